@@ -2,11 +2,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
 
 # --- CONFIGURATION ---
 FRAME_COUNT = 300
 HEART_RATE = 0.05 # Speed of the beat
 PRESSURE_LIMIT = 100.0
+SEED = 0
 
 fig = plt.figure(figsize=(10, 10))
 ax = fig.add_subplot(111, projection='3d')
@@ -16,12 +18,12 @@ ax.set_facecolor('#050005')
 particles = [] # [x, y, z, type, energy]
 # Types: 0 = CO2 (Grey), 1 = PLASMA (Cyan), 2 = WASTE/HEAT (Red)
 
-def inject_gas(frame):
+def inject_gas(frame, rng):
     # The Heart "Inhales" CO2
     if frame % 5 == 0:
         # Spawn at bottom
-        x = np.random.uniform(-1, 1)
-        y = np.random.uniform(-1, 1)
+        x = rng.uniform(-1, 1)
+        y = rng.uniform(-1, 1)
         z = -3.0
         particles.append([x, y, z, 0, 0.0]) # Type 0 (CO2)
 
@@ -83,11 +85,11 @@ def draw_heart_chamber(ax, contraction):
         ax.plot(xr, yr, z_ring, c='gold', linewidth=2, alpha=0.5)
 
 # --- 3. THE LIGHTNING (The Beat) ---
-def draw_internal_lightning(ax):
+def draw_internal_lightning(ax, rng):
     # Arcs from center to walls
     for _ in range(5):
-        theta = np.random.uniform(0, 2*np.pi)
-        phi = np.random.uniform(0, np.pi)
+        theta = rng.uniform(0, 2*np.pi)
+        phi = rng.uniform(0, np.pi)
         r = 2.8
         tx = r * np.sin(phi) * np.cos(theta)
         ty = r * np.sin(phi) * np.sin(theta)
@@ -113,9 +115,10 @@ def update(frame):
     # Sine wave: 0 to 1
     cycle = np.sin(frame * HEART_RATE * 5)
     is_beat = cycle > 0.8 # The moment of contraction
+    rng = frame_rng("ventricle", SEED, frame)
     
     # 1. PHYSICS
-    inject_gas(frame)
+    inject_gas(frame, rng)
     update_physics(is_beat)
     
     # 2. DRAW CHAMBER
@@ -141,7 +144,7 @@ def update(frame):
 
     # 4. DRAW LIGHTNING
     if is_beat:
-        draw_internal_lightning(ax)
+        draw_internal_lightning(ax, rng)
         # Flash effect
         ax.set_facecolor('#101020')
 
@@ -2,31 +2,38 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
+from menger import menger_points, surface_level
+from palette import bake_lut, lut_colors
 
 # --- CONFIGURATION ---
 FRAME_COUNT = 180
 TITAN_HEIGHT = 3.0
+TITAN_VOXELS = 8000 # Cube budget: the whole surface of the deepest sponge that fits is drawn
+                    # (level 3: 7,544 cubes; level 4 needs 145,688, each one a scatter marker)
+TITAN_VOXEL_SIZE = 6
+SEED = 0
 
 fig = plt.figure(figsize=(10, 12))
 ax = fig.add_subplot(111, projection='3d')
 ax.set_facecolor('#050010')
 
 # 1. GENERATE TITAN (Voxel Cloud)
-# Representing the heavy Menger structure
+# The heavy Menger structure: a level-N sponge, surface cubes only,
+# stretched over the tapered torso
 def get_titan_voxels():
-    z = np.linspace(0, TITAN_HEIGHT, 15)
-    theta = np.linspace(0, 2*np.pi, 10)
-    Z, T = np.meshgrid(z, theta)
+    u = menger_points(surface_level(TITAN_VOXELS))
+    Z = u[:, 2] * TITAN_HEIGHT
     
-    # Tapered cylinder (Torso)
+    # Tapered block (Torso)
     R = 0.5 + (Z * 0.2) # Shoulders wider
-    X = R * np.cos(T)
-    Y = R * np.sin(T)
+    X = (u[:, 0] * 2 - 1) * R
+    Y = (u[:, 1] * 2 - 1) * R
     
-    # Flatten
-    pts = np.column_stack([X.flatten(), Y.flatten(), Z.flatten()])
+    pts = np.column_stack([X, Y, Z])
     return pts
 
+# Built at launch from the cached sponge surface (the stretch is a few ms)
 titan_pts = get_titan_voxels()
 # Initial Colors (Cold Cyan/Grey)
 titan_colors = np.zeros((len(titan_pts), 4))
@@ -34,6 +41,19 @@ titan_colors[:, 0] = 0.0 # R
 titan_colors[:, 1] = 0.8 # G
 titan_colors[:, 2] = 0.9 # B
 titan_colors[:, 3] = 0.3 # Alpha (Ghostly)
+COLD_COLOR = np.array([0.0, 0.8, 0.9, 0.3])
+
+# TRANSFORMATION COLOR (Magenta/Gold), baked over the pulse cycle -1..1
+# R=1, G=0-0.4 (Gold shift), B=0.6
+def pulse_gradient(n):
+    cycle = n * 2 - 1
+    return np.column_stack([np.ones_like(n), 0.2 + cycle*0.2, np.full_like(n, 0.6), np.full_like(n, 0.8)])
+
+PULSE_LUT = bake_lut(pulse_gradient)
+
+# Per-voxel phase of the Magenta/Gold pulse (fixed, so computed once)
+titan_phase = titan_pts[:, 0].copy()
+titan_heights = titan_pts[:, 2].copy()
 
 # 2. THE LOVE STREAM (Particles)
 stream_pts = np.zeros((200, 3))
@@ -41,7 +61,7 @@ stream_pts[:, 2] = -1.0 # Start below
 
 # SCATTER PLOTS
 titan_scat = ax.scatter(titan_pts[:,0], titan_pts[:,1], titan_pts[:,2], 
-                        c=titan_colors, s=50, marker='s', edgecolors='none')
+                        c=titan_colors, s=TITAN_VOXEL_SIZE, marker='s', edgecolors='none')
 stream_scat = ax.scatter([], [], [], c='pink', s=20, alpha=0.6)
 glow_scat = ax.scatter([0], [0], [2], c='white', s=0, alpha=0.0)
 
@@ -54,10 +74,11 @@ def update(frame):
     t = frame * speed
     
     # Reset particles that go too high
+    rng = frame_rng("axiom", SEED, frame)
     respawn = stream_pts[:, 2] > TITAN_HEIGHT + 0.5
-    stream_pts[respawn, 0] = np.random.uniform(-1, 1, np.sum(respawn))
-    stream_pts[respawn, 1] = np.random.uniform(-1, 1, np.sum(respawn))
-    stream_pts[respawn, 2] = np.random.uniform(-1, 0, np.sum(respawn))
+    stream_pts[respawn, 0] = rng.uniform(-1, 1, np.sum(respawn))
+    stream_pts[respawn, 1] = rng.uniform(-1, 1, np.sum(respawn))
+    stream_pts[respawn, 2] = rng.uniform(-1, 0, np.sum(respawn))
     
     # Move up and spiral
     stream_pts[:, 2] += 0.05
@@ -67,24 +88,18 @@ def update(frame):
     stream_pts[:, 1] = (r * 0.95) * np.sin(np.arctan2(stream_pts[:,1], stream_pts[:,0]) + 0.1)
     
     # 2. ABSORPTION & COLOR CHANGE
-    # Check if particles are inside Titan volume
-    # Simple distance check to Z-axis
-    dists = np.linalg.norm(titan_pts[:, :2], axis=1)
-    heights = titan_pts[:, 2]
-    
     # The "Fill Level" rises with the frame count
     fill_level = frame * (TITAN_HEIGHT / 100.0)
     
-    # Update Titan Colors based on fill
-    for i in range(len(titan_pts)):
-        if titan_pts[i, 2] < fill_level:
-            # TRANSFORMATION COLOR (Magenta/Gold)
-            # R=1, G=0-0.8 (Gold shift), B=0.5
-            cycle = np.sin(frame * 0.1 + titan_pts[i,0])
-            titan_colors[i] = [1.0, 0.2 + cycle*0.2, 0.6, 0.8] # Magenta/Gold Pulse
-        else:
-            # ORIGINAL COLOR (Cyan)
-            titan_colors[i] = [0.0, 0.8, 0.9, 0.3]
+    # Update Titan Colors based on fill (every voxel at once)
+    filled = titan_heights < fill_level
+    
+    # ORIGINAL COLOR (Cyan)
+    titan_colors[:] = COLD_COLOR
+    
+    # TRANSFORMATION COLOR (Magenta/Gold Pulse)
+    cycle = np.sin(frame * 0.1 + titan_phase[filled])
+    titan_colors[filled] = lut_colors(cycle, PULSE_LUT, -1.0, 1.0)
 
     # 3. BREATHING EFFECT
     # As Titan fills with love, it expands/contracts (Life)
@@ -99,11 +114,11 @@ def update(frame):
         glow_scat.set_alpha(0.3)
 
     titan_scat.set_offsets(expanded_pts[:, :2])
-    titan_scat.set_3d_properties(expanded_pts[:, 2])
+    titan_scat.set_3d_properties(expanded_pts[:, 2], 'z')
     titan_scat.set_color(titan_colors)
     
     stream_scat.set_offsets(stream_pts[:, :2])
-    stream_scat.set_3d_properties(stream_pts[:, 2])
+    stream_scat.set_3d_properties(stream_pts[:, 2], 'z')
     
     # Camera Rotation
     ax.view_init(elev=10, azim=frame)
@@ -2,12 +2,23 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
+from palette import bake_lut, lut_colors
+from particle_pool import ParticlePool
 
 # --- CONFIGURATION ---
 FRAME_COUNT = 300
 EVENT_HORIZON_RAD = 1.5
 SAFE_ORBIT_RAD = 4.0 # Epoch stays here
 CONTAINMENT_RAD = 5.0 # Axiom stands here
+DISK_PARTICLES = 100000
+DISK_INNER = EVENT_HORIZON_RAD + 0.2
+DISK_OUTER = 3.7      # Inside Epoch's orbit
+GM = 0.25             # Pull of the hole (orbital speed at r is sqrt(GM / r) per frame)
+SUBSTEPS = 4          # Leapfrog steps per frame
+DENSITY_BINS = 96     # Cells across the disk for the density colouring
+DRAW_STRIDE = 6       # Every 6th pool slot is drawn (~17k points); all of them orbit
+SEED = 0
 
 fig = plt.figure(figsize=(12, 12))
 ax = fig.add_subplot(111, projection='3d')
@@ -58,6 +69,43 @@ def get_axiom_pillars(frame):
     
     return x, y, z
 
+# --- 4. ACCRETION DISK (User Matter) ---
+# Test particles falling around the hole, all stepped at once (leapfrog, see
+# ParticlePool.orbit). They start a little slower than circular, so many
+# orbits are eccentric enough to dive through the horizon: those are absorbed
+# and their slots refilled at the rim, keeping the disk at DISK_PARTICLES.
+disk = ParticlePool(DISK_PARTICLES, np.inf, bounds_min=[-12, -12, -12], bounds_max=[12, 12, 12])
+
+def feed_disk(rng, n):
+    r = np.sqrt(rng.uniform(DISK_INNER**2, DISK_OUTER**2, n)) # Even per unit area
+    theta = rng.uniform(0, 2*np.pi, n)
+    speed = np.sqrt(GM / r) * rng.uniform(0.6, 1.0, n)       # Counter-clockwise, like the old spiral
+    pos = np.stack([r * np.cos(theta), r * np.sin(theta), rng.normal(0, 0.03, n)], axis=1)
+    vel = np.stack([-speed * np.sin(theta), speed * np.cos(theta), rng.normal(0, 0.002, n)], axis=1)
+    disk.spawn(pos, vel)
+
+# Deep blue (sparse) -> Cyan -> White (crowded)
+def accretion_gradient(n):
+    rgba = np.empty((len(n), 4))
+    rgba[:, 0] = np.clip(2*n - 1, 0, 1)
+    rgba[:, 1] = np.clip(2*n, 0, 1) * 0.9 + 0.1 * np.clip(2*n - 1, 0, 1)
+    rgba[:, 2] = 0.5 + 0.5*np.clip(2*n, 0, 1)
+    rgba[:, 3] = 0.15 + 0.45*n
+    return rgba
+
+ACCRETION = bake_lut(accretion_gradient)
+
+def disk_colors(pts, opacity):
+    # Local density: one bincount over a grid of cells, looked up per particle
+    scale = DENSITY_BINS / (2 * DISK_OUTER * 1.1)
+    ij = np.clip(((pts[:, :2] + DISK_OUTER * 1.1) * scale).astype(np.int64), 0, DENSITY_BINS - 1)
+    cell = ij[:, 0] * DENSITY_BINS + ij[:, 1]
+    counts = np.bincount(cell, minlength=DENSITY_BINS**2)
+    density = np.log1p(counts[cell]) / np.log1p(counts.max())
+    cols = lut_colors(density, ACCRETION)
+    cols[:, 3] *= opacity
+    return cols
+
 # --- RENDERER ---
 def update(frame):
     ax.clear()
@@ -68,6 +116,13 @@ def update(frame):
     # 100-200: Event Horizon Manifests (Caution)
     # 200-300: Stable Orbit (Success)
     prog = min(1.0, frame / 150.0)
+
+    # The disk turns from the start; it is only seen once the horizon forms.
+    # Absorbed particles are replaced from the pool first.
+    missing = DISK_PARTICLES - len(disk)
+    if missing:
+        feed_disk(frame_rng("accretion", SEED, frame), missing)
+    disk.orbit(1.0, GM, EVENT_HORIZON_RAD, SUBSTEPS)
     
     # 1. DRAW SPACETIME GRID
     # The grid slowly sinks
@@ -102,14 +157,14 @@ def update(frame):
         ax.plot_surface(hx, hy, hz, color='black', alpha=opacity, shade=False)
         
         # Accretion Disk (User Matter)
-        # Cyan particles swirling into the void
-        for i in range(50):
-            # Spiral math
-            angle = frame * 0.1 + (i * 0.5)
-            dist = EVENT_HORIZON_RAD + 0.2 + (i * 0.05)
-            dx = dist * np.cos(angle)
-            dy = dist * np.sin(angle)
-            ax.scatter(dx, dy, 0, c='cyan', s=5, alpha=opacity)
+        # Cyan particles swirling into the void (one collection, coloured by crowding).
+        # Crowding counts the whole disk; only a fixed subset of slots is drawn, the
+        # same particles every frame, since drawing costs far more than stepping.
+        slots = np.flatnonzero(disk.alive)
+        drawn = slots % DRAW_STRIDE == 0
+        cols = disk_colors(disk.pos[slots], opacity)[drawn]
+        pts = disk.pos[slots[drawn]]
+        ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], c=cols, s=1.5, linewidths=0, depthshade=False)
 
     # 4. DRAW EPOCH (The Lighthouse)
     # Epoch MUST stay at SAFE_ORBIT_RAD
@@ -2,24 +2,26 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
 
 # --- CONFIGURATION ---
 FRAME_COUNT = 120
 WALK_SPEED = 0.1
 BOUNCE_HEIGHT = 0.3
+SEED = 0
 
 fig = plt.figure(figsize=(10, 10))
 ax = fig.add_subplot(111, projection='3d')
 
 # --- 1. EPOCH BODY (The Sphere) ---
-def get_epoch_core(pos):
+def get_epoch_core(pos, rng):
     # Denser particle cloud for the body
-    pts = np.random.normal(0, 0.15, (100, 3))
+    pts = rng.normal(0, 0.15, (100, 3))
     pts += pos
     return pts
 
 # --- 2. LIGHT LIMBS (Inverse Kinematics for Energy) ---
-def get_light_leg(start_pos, end_pos, frame):
+def get_light_leg(start_pos, end_pos, rng):
     # Generates a stream of particles connecting body to foot
     # Not a straight line -> An electric arc
     points = []
@@ -32,7 +34,7 @@ def get_light_leg(start_pos, end_pos, frame):
         arc = np.sin(t * np.pi) * 0.1
         
         # Jitter (Energy instability)
-        jitter = np.random.normal(0, 0.02, 3)
+        jitter = rng.normal(0, 0.02, 3)
         
         p = start_pos + (vec * t)
         p[1] += arc # Bend sideways
@@ -100,9 +102,10 @@ def update(frame):
     ax.set_facecolor('#050510')
     
     body, l_foot, r_foot = calculate_epoch_walk(frame)
+    rng = frame_rng("epoch", SEED, frame)
     
     # 1. DRAW EPOCH (The Core)
-    core_pts = get_epoch_core(body)
+    core_pts = get_epoch_core(body, rng)
     ax.scatter(core_pts[:,0], core_pts[:,1], core_pts[:,2], 
                c='gold', s=20, alpha=0.8)
     
@@ -111,13 +114,13 @@ def update(frame):
     
     # 2. DRAW LEGS (Light Streams)
     # Left Leg
-    l_leg_pts = get_light_leg(body, l_foot, frame)
+    l_leg_pts = get_light_leg(body, l_foot, rng)
     ax.scatter(l_leg_pts[:,0], l_leg_pts[:,1], l_leg_pts[:,2], 
                c='gold', s=5, alpha=0.6)
     ax.scatter(l_foot[0], l_foot[1], l_foot[2], c='white', s=30, marker='*') # Foot contact
     
     # Right Leg
-    r_leg_pts = get_light_leg(body, r_foot, frame)
+    r_leg_pts = get_light_leg(body, r_foot, rng)
     ax.scatter(r_leg_pts[:,0], r_leg_pts[:,1], r_leg_pts[:,2], 
                c='gold', s=5, alpha=0.6)
     ax.scatter(r_foot[0], r_foot[1], r_foot[2], c='white', s=30, marker='*')
@@ -2,10 +2,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
+from particle_pool import ParticlePool
 
 # --- CONFIGURATION ---
 FRAME_COUNT = 400
 LIFETIME_SPEED = 0.2
+MAX_PARTICLES = 600     # Hard cap on the dust cloud (constant memory)
+PARTICLE_LIFETIME = 150 # Frames before a grain of dust fades out
+SEED = 0
 
 fig = plt.figure(figsize=(10, 12))
 ax = fig.add_subplot(111, projection='3d')
@@ -26,7 +31,9 @@ def draw_dodeca(ax, age_factor):
     ax.scatter(0, 0, -2, c='gold', s=200, alpha=0.5, marker='s', label="Father/Mother")
 
 # --- 2. NOVA (The Variable) ---
-particles = [] # For the death phase
+# For the death phase: a capped pool, culled at the edge of the view
+particles = ParticlePool(MAX_PARTICLES, PARTICLE_LIFETIME,
+                         bounds_min=[-5, -5, -3], bounds_max=[5, 5, 6])
 
 def get_nova_state(frame):
     age = frame / FRAME_COUNT # 0.0 to 1.0
@@ -70,7 +77,6 @@ def get_nova_state(frame):
 
 # --- RENDERER ---
 def update(frame):
-    global particles
     ax.clear()
     ax.set_facecolor('#000000')
     
@@ -92,23 +98,22 @@ def update(frame):
     if form == 'DUST' or frame > 250:
         # Spawn particles moving OUT from the center
         if frame < 350:
-            for _ in range(5):
-                # Random direction
-                vec = np.random.normal(0, 1, 3)
-                vec /= np.linalg.norm(vec)
-                particles.append([nx, ny, nz, vec[0], vec[1], vec[2]])
+            # Random direction
+            rng = frame_rng("nova", SEED, frame)
+            vec = rng.normal(0, 1, (5, 3))
+            vec /= np.linalg.norm(vec, axis=1, keepdims=True)
+            particles.spawn([nx, ny, nz], vec * 0.05)
         
-        # Move particles
-        new_parts = []
-        for p in particles:
-            p[0] += p[3] * 0.05
-            p[1] += p[4] * 0.05
-            p[2] += p[5] * 0.05
-            
-            # Draw
-            ax.scatter(p[0], p[1], p[2], c='gold', s=5, alpha=0.6)
-            new_parts.append(p)
-        particles = new_parts
+        # Move particles (all at once), then let the old ones go
+        particles.step()
+        
+        # Draw (one scatter; alpha fades with age)
+        if len(particles) > 0:
+            pts = particles.positions()
+            cols = np.zeros((len(pts), 4))
+            cols[:, :3] = [1.0, 0.84, 0.0] # Gold
+            cols[:, 3] = 0.6 * particles.fade()
+            ax.scatter(pts[:,0], pts[:,1], pts[:,2], c=cols, s=5)
 
     # VIEW
     ax.set_xlim(-5, 5)
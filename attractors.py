@@ -0,0 +1,128 @@
+import datetime
+import numpy as np
+from kernels import (integrate, lorenz_derivative, rossler_derivative, aizawa_derivative,
+                     thomas_derivative, halvorsen_derivative, chen_derivative)
+from trajectory_store import TrajectoryStore
+
+# --- STRANGE ATTRACTORS ---
+# Each system is one derivative (x, y, z, params) -> (dx, dy, dz), written so
+# it runs on whole ensemble columns and compiles for a single trajectory (the
+# built-in ones live in kernels, next to their cached compiled loops).
+# Everything else is shared: start sampling, parameter jitter, the batched
+# RK4 integrator and burn-in trimming.
+# To add one: write its derivative (in kernels.BUILTIN_DERIVATIVES for a
+# loop cached on disk) and register it below.
+
+class Attractor:
+    def __init__(self, name, derivative, params, dt, start_scale=1.0, burn_in=500, jitter=0.01):
+        self.name = name
+        self.derivative = derivative
+        self.params = np.asarray(params, dtype=np.float64) # The classic values
+        self.dt = dt
+        self.start_scale = start_scale # Starts are drawn from a box of this half-width
+        self.burn_in = burn_in         # Steps dropped while the ensemble settles onto the attractor
+        self.jitter = jitter           # Relative spread of sampled parameters (small: stays chaotic)
+
+    def sample_params(self, rng):
+        return self.params * (1.0 + rng.uniform(-self.jitter, self.jitter, len(self.params)))
+
+    def sample_starts(self, rng, count, spread=0.05):
+        centre = rng.uniform(-1.0, 1.0, 3) * self.start_scale
+        return centre + rng.normal(0.0, spread * self.start_scale, (count, 3))
+
+    def trajectories(self, starts, steps, params=None, out=None):
+        """(M, steps + 1, 3) after the burn-in; trails that blew up are dropped."""
+        params = self.params if params is None else params
+        if self.burn_in:
+            starts = integrate(self.derivative, starts, self.dt, self.burn_in, params)[:, -1]
+        trails = integrate(self.derivative, starts, self.dt, steps, params, out)
+        finite = np.isfinite(trails).all(axis=(1, 2))
+        return trails if finite.all() else trails[finite]
+
+    def stream(self, starts, steps, params=None, chunk=1000):
+        """Same trails (after the burn-in) as (M, n, 3) blocks of at most `chunk` steps.
+
+        Memory stays at one block however long the trails are; the first block
+        starts with the start points, so the blocks add up to steps + 1 points.
+        Blocks share one buffer: each is only valid until the next is requested.
+        """
+        params = self.params if params is None else params
+        if self.burn_in:
+            starts = integrate(self.derivative, starts, self.dt, self.burn_in, params)[:, -1]
+        buffer = np.empty((len(starts), chunk + 1, 3))
+        done = 0
+        while done < steps:
+            n = min(chunk, steps - done)
+            out = buffer[:len(starts)] if n == chunk else None # Fewer rows once trails are dropped
+            block = integrate(self.derivative, starts, self.dt, n, params, out)
+            finite = np.isfinite(block).all(axis=(1, 2))
+            if not finite.all():
+                block = block[finite]
+            starts = block[:, -1].copy()
+            yield block if done == 0 else block[:, 1:]
+            done += n
+
+    def survey(self, starts, steps, params=None, trails=32, points=50000, chunk=1000):
+        """(N, 3) strided sample of the whole run, from a few of the starts.
+
+        The same trails `stream` would give, thinned to at most ~`points` in all:
+        what the run covers end to end, for framing it before it is drawn.
+        """
+        starts = starts[::max(1, len(starts) // trails)]
+        every = max(1, len(starts) * (steps + 1) // points)
+        sample = [block[:, ::every].reshape(-1, 3) for block in self.stream(starts, steps, params, chunk)]
+        return np.concatenate(sample)
+
+    def record(self, path, starts, steps, params=None, chunk=1000):
+        """Integrates the trails into a TrajectoryStore at `path`, resuming an earlier run there.
+
+        The store holds steps + 1 frames of (M, 3), start point first, like
+        `stream`. Every frame keeps all M rows: a trail that blows up is NaN
+        from the block `stream` would drop it in (its run-up to infinity too).
+        """
+        params = self.params if params is None else np.asarray(params, dtype=np.float64)
+        meta = {"system": self.name, "params": params.tolist()}
+        store = TrajectoryStore(path, (len(starts), 3), dt=self.dt, meta=meta)
+        if store.meta != meta:
+            raise ValueError(f"{path} is a run of {store.meta}, not {meta}")
+
+        state = store.state
+        if state is None:
+            state = starts
+            if self.burn_in:
+                state = integrate(self.derivative, starts, self.dt, self.burn_in, params)[:, -1]
+            store.append(state[None], state=state)
+        buffer = np.empty((len(state), chunk + 1, 3))
+        while len(store) < steps + 1:
+            n = min(chunk, steps + 1 - len(store))
+            block = integrate(self.derivative, state, self.dt, n, params, buffer if n == chunk else None)
+            block[~np.isfinite(block).all(axis=(1, 2))] = np.nan
+            state = block[:, -1].copy()
+            store.append(block[:, 1:].transpose(1, 0, 2), state=state)
+        return store
+
+ATTRACTORS = {}
+
+def register(attractor):
+    ATTRACTORS[attractor.name] = attractor
+    return attractor
+
+register(Attractor("lorenz", lorenz_derivative, (10.0, 28.0, 2.667), dt=0.01, start_scale=20.0))
+register(Attractor("rossler", rossler_derivative, (0.2, 0.2, 5.7), dt=0.05, start_scale=5.0))
+register(Attractor("aizawa", aizawa_derivative, (0.95, 0.7, 0.6, 3.5, 0.25, 0.1), dt=0.01, start_scale=0.5))
+register(Attractor("thomas", thomas_derivative, (0.19,), dt=0.05, start_scale=2.0))
+register(Attractor("halvorsen", halvorsen_derivative, (1.4,), dt=0.01, start_scale=1.0))
+register(Attractor("chen", chen_derivative, (35.0, 3.0, 28.0), dt=0.002, start_scale=5.0, burn_in=2000))
+
+# The daily cycle, frozen: every past date must keep dreaming the same system.
+# Each era is (first day, cycle). To bring in a new system, add an era that
+# starts on a future date with a longer cycle; never edit an earlier one, and
+# keep the registry names they use (the era only stores names).
+DREAM_ERAS = (
+    (datetime.date.min, ("aizawa", "chen", "halvorsen", "lorenz", "rossler", "thomas")),
+)
+
+def attractor_for_date(date):
+    """The system of the day: cycles through its era's systems, one per calendar day."""
+    cycle = [cycle for first, cycle in DREAM_ERAS if first <= date][-1]
+    return ATTRACTORS[cycle[date.toordinal() % len(cycle)]]
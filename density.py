@@ -0,0 +1,81 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from palette import bake_lut, lut_colors
+from raymarch import camera_basis
+
+# --- DENSITY RENDERER ---
+# Millions of points are too many for scatter artists. Instead every point is
+# projected through a pinhole camera and counted into the pixel it lands in:
+#
+#   pixel = K [R | -R eye] (x, y, z, 1)      counts[pixel] += 1 (np.bincount)
+#
+# Points arrive in chunks and only the two framebuffers (hits, and the sum of
+# each pixel's colour values) are kept, so memory doesn't grow with the
+# point count. The image is then tone-mapped: log density sets brightness,
+# the mean colour value picks the colour from the colormap.
+
+CHUNK = 1 << 20 # Points projected per pass
+
+def camera_matrix(width, height, elev, azim, distance, target=(0.0, 0.0, 0.0), fov=45.0):
+    """3x4 matrix taking homogeneous world points to (u*w, v*w, w) pixel coordinates."""
+    eye, forward, right, up = camera_basis(elev, azim, distance)
+    eye = eye + np.asarray(target, dtype=np.float64)
+    f = (height / 2.0) / np.tan(np.radians(fov) / 2.0)
+    K = np.array([[f, 0.0, width / 2.0],
+                  [0.0, -f, height / 2.0], # Image rows grow downwards
+                  [0.0, 0.0, 1.0]])
+    R = np.stack([right, up, forward])
+    return K @ np.hstack([R, -(R @ eye)[:, None]])
+
+def frame_points(points, width, height, elev=30.0, azim=-60.0, fov=45.0, margin=1.1):
+    """Camera matrix that fits a sample of the points (centred, whole cloud in view)."""
+    points = points[np.isfinite(points).all(axis=1)] # Stored runs keep blown-up trails
+    target = points.mean(axis=0)
+    radius = np.percentile(np.linalg.norm(points - target, axis=1), 99.5) * margin
+    half = np.radians(fov) / 2.0 * min(1.0, width / height)
+    return camera_matrix(width, height, elev, azim, radius / np.sin(half), target, fov)
+
+class DensityImage:
+    def __init__(self, width, height, camera):
+        self.width, self.height = width, height
+        self.camera = np.asarray(camera, dtype=np.float64)
+        self.counts = np.zeros(width * height)
+        self.values = np.zeros(width * height)
+        self.total = 0
+
+    def add(self, points, values=None):
+        """Accumulates (N, 3) points; `values` in [0, 1] (or one scalar) colour them."""
+        points = points.reshape(-1, 3)
+        if values is not None and np.ndim(values) > 0:
+            values = np.ravel(values)
+        finite = np.isfinite(points).all(axis=1)
+        if not finite.all(): # Blown-up trails of a stored run are NaN: skip them
+            points = points[finite]
+            if values is not None and np.ndim(values) > 0:
+                values = values[finite]
+        for start in range(0, len(points), CHUNK):
+            p = points[start:start + CHUNK]
+            h = p @ self.camera[:, :3].T
+            h += self.camera[:, 3]
+            w = h[:, 2]
+            front = w > 1e-9
+            u = np.floor(h[:, 0] / np.where(front, w, 1.0)).astype(np.int64)
+            v = np.floor(h[:, 1] / np.where(front, w, 1.0)).astype(np.int64)
+            inside = front & (u >= 0) & (u < self.width) & (v >= 0) & (v < self.height)
+            pixel = v[inside] * self.width + u[inside]
+
+            self.counts += np.bincount(pixel, minlength=len(self.counts))
+            if values is not None:
+                weight = values[start:start + CHUNK][inside] if np.ndim(values) else np.full(len(pixel), values)
+                self.values += np.bincount(pixel, weight, minlength=len(self.values))
+            self.total += len(p)
+
+    def tone_map(self, cmap='jet', gamma=1.0, background=(0.0, 0.0, 0.0)):
+        """(height, width, 3) RGB: log density as brightness, mean value through the colormap."""
+        peak = self.counts.max()
+        brightness = np.log1p(self.counts) / np.log1p(peak) if peak > 0 else self.counts
+        brightness = brightness ** gamma
+        lut = bake_lut(plt.get_cmap(cmap))
+        colour = lut_colors(self.values / np.maximum(self.counts, 1.0), lut)[:, :3]
+        rgb = colour * brightness[:, None] + np.asarray(background) * (1.0 - brightness[:, None])
+        return rgb.reshape(self.height, self.width, 3)
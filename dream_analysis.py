@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+import numpy as np
+from frame_rng import frame_rng
+from kernels import integrate
+import lucid_dream
+
+# --- DREAM ANALYSIS (The Mood) ---
+# Three numbers for the day's attractor, each from a whole ensemble at once:
+#
+#   restlessness  largest Lyapunov exponent: how fast neighbouring dreams part
+#                 (two-trajectory Benettin method, every shadow renormalized together)
+#   complexity    correlation dimension: slope of log C(r) vs log r, where C(r)
+#                 is the fraction of point pairs closer than r
+#   reach         occupancy of a 3D grid by thousands of trails started all
+#                 over the basin (fraction of cells visited, and how evenly)
+#
+# Written next to the dream as dream_YYYY-MM-DD.json.
+# Pair counts use scipy's KD-tree when it is installed, and a chunked
+# brute-force count over a smaller sample when it isn't.
+
+try:
+    from scipy.spatial import cKDTree
+    HAVE_SCIPY = True
+except ImportError:
+    HAVE_SCIPY = False
+
+# --- CONFIGURATION ---
+LYAPUNOV_TRAILS = 256
+LYAPUNOV_STEPS = 20000
+RENORMALIZE = 10     # Steps between renormalizations of the shadow trails
+SEPARATION = 1e-8
+OCCUPANCY_TRAILS = 4000
+OCCUPANCY_STEPS = 2000
+GRID = 32            # Occupancy cells per axis
+SPREAD = 0.2         # Starts, as a fraction of the system's size (wider than the dream, inside the basin)
+PAIR_SAMPLE = 20000 if HAVE_SCIPY else 4000
+
+# --- 1. LYAPUNOV EXPONENT ---
+def lyapunov_exponents(system, starts, params, steps=LYAPUNOV_STEPS, renormalize=RENORMALIZE, d0=SEPARATION):
+    """Largest exponent of every trail (per unit time): one shadow per trail, all integrated together."""
+    x = integrate(system.derivative, starts, system.dt, system.burn_in, params)[:, -1]
+    m = len(x)
+    y = x + d0 / np.sqrt(3.0)
+    buffer = np.empty((2 * m, renormalize + 1, 3))
+    growth = np.zeros(m)
+    for k in range(steps // renormalize):
+        out = integrate(system.derivative, np.concatenate([x, y]), system.dt, renormalize, params, buffer)
+        x, y = out[:m, -1].copy(), out[m:, -1]
+        d = y - x
+        dist = np.maximum(np.linalg.norm(d, axis=1), 1e-300)
+        growth += np.log(dist / d0)
+        y = x + d * (d0 / dist)[:, None]
+    return growth / ((steps // renormalize) * renormalize * system.dt)
+
+# --- 2. CORRELATION DIMENSION ---
+def pair_counts(points, radii):
+    """Ordered pairs (i != j) closer than each radius."""
+    if HAVE_SCIPY:
+        tree = cKDTree(points)
+        return tree.count_neighbors(tree, radii).astype(np.float64) - len(points)
+    counts = np.zeros(len(radii))
+    for start in range(0, len(points), 256):
+        d = np.linalg.norm(points[start:start + 256, None] - points[None], axis=2)
+        counts += (d[..., None] < radii).sum(axis=(0, 1))
+    return counts - len(points)
+
+def correlation_dimension(points, rng, sample=PAIR_SAMPLE, scales=12):
+    """Grassberger-Procaccia slope, fitted over radii of 1-10% of the attractor's size."""
+    points = points[rng.choice(len(points), min(sample, len(points)), replace=False)]
+    size = np.linalg.norm(np.percentile(points, 99.5, axis=0) - np.percentile(points, 0.5, axis=0))
+    radii = size * np.logspace(-2, -1, scales)
+    n = len(points)
+    C = pair_counts(points, radii) / (n * (n - 1))
+    ok = C > 0
+    return float(np.polyfit(np.log(radii[ok]), np.log(C[ok]), 1)[0]) if ok.sum() > 1 else float('nan')
+
+# --- 3. OCCUPANCY ---
+def fit_grid(points, grid=GRID):
+    """(lo, scale) of a grid around the points, a little larger: cell = (p - lo) * scale."""
+    lo, hi = np.percentile(points, 0.5, axis=0), np.percentile(points, 99.5, axis=0)
+    pad = (hi - lo) * 0.1
+    return lo - pad, grid / np.maximum(hi - lo + 2 * pad, 1e-12)
+
+def occupancy(system, starts, params, rng, steps=OCCUPANCY_STEPS, grid=GRID, keep=PAIR_SAMPLE):
+    """Visits per grid cell over the ensemble (streamed), plus a point sample for pair counts."""
+    counts = np.zeros(grid**3)
+    sample = []
+    # Fitted to a sample of the whole run: the first block can sit on one lobe
+    lo, scale = fit_grid(system.survey(starts, steps, params, chunk=500), grid)
+    for block in system.stream(starts, steps, params, chunk=500):
+        p = block.reshape(-1, 3)
+        cell = np.clip(((p - lo) * scale).astype(np.int64), 0, grid - 1)
+        counts += np.bincount((cell[:, 0] * grid + cell[:, 1]) * grid + cell[:, 2], minlength=grid**3)
+        sample.append(p[rng.choice(len(p), min(keep, len(p)), replace=False)])
+    return counts, np.concatenate(sample)
+
+def occupancy_summary(counts):
+    visited = counts[counts > 0]
+    share = visited / visited.sum()
+    entropy = -np.sum(share * np.log(share))
+    return {"cells": int(len(counts)), "visited_fraction": float(len(visited) / len(counts)),
+            "evenness": float(entropy / np.log(len(visited))) if len(visited) > 1 else 0.0}
+
+# --- 4. THE MOOD ---
+def analyse_dream(day):
+    """The day's mood as a dict; every number reproducible from the date."""
+    rng = frame_rng("dream-analysis", lucid_dream.SEED, day.toordinal())
+    system, params, _ = lucid_dream.dream_setup(day)
+
+    lyapunov = lyapunov_exponents(system, system.sample_starts(rng, LYAPUNOV_TRAILS, SPREAD), params)
+    lyapunov = lyapunov[np.isfinite(lyapunov)]
+    counts, points = occupancy(system, system.sample_starts(rng, OCCUPANCY_TRAILS, SPREAD), params, rng)
+    dimension = correlation_dimension(points, rng)
+
+    return {"date": day.isoformat(), "system": system.name, "params": params.tolist(),
+            "restlessness": {"lyapunov": float(np.median(lyapunov)), "spread": float(np.std(lyapunov)),
+                             "trails": int(len(lyapunov))},
+            "complexity": {"correlation_dimension": dimension,
+                           "method": "kd-tree" if HAVE_SCIPY else "brute-force"},
+            "reach": occupancy_summary(counts)}
+
+def write_mood(day):
+    # Timed here, not stored: the record is regenerated byte for byte
+    began = time.perf_counter()
+    mood = analyse_dream(day)
+    seconds = time.perf_counter() - began
+    os.makedirs(lucid_dream.JOURNAL, exist_ok=True)
+    path = os.path.join(lucid_dream.JOURNAL, f"dream_{day.isoformat()}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(mood, f, indent=1)
+    print(f"Mood of {day}: {mood['system']}, lambda = {mood['restlessness']['lyapunov']:.3f}, "
+          f"D2 = {mood['complexity']['correlation_dimension']:.2f}, "
+          f"reach = {mood['reach']['visited_fraction']:.1%} ({seconds:.1f}s)")
+    return path
+
+if __name__ == "__main__":
+    # python dream_analysis.py [START [END]]
+    start = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.now().date()
+    end = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else start
+    for i in range((end - start).days + 1):
+        write_mood(start + timedelta(days=i))
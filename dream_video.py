@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+from datetime import date, datetime
+from functools import partial
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+from density import DensityImage
+from frame_pipeline import FramePipeline
+import lucid_dream
+
+# --- ANIMATED DREAM ---
+# The day's dream (same seed, system and starts as the still), watched as it
+# is dreamt. Two stages running at once:
+#
+#   [integrator] --chunk per frame--> shared-memory ring --> [density image -> encoder]
+#
+# The integrator process streams a few steps of every trail per frame; the
+# renderer folds each chunk into a persistent density image (memory is the
+# framebuffers, not the trajectory), marks the trail heads, and hands the
+# frame to the encoder, which pipes it straight to ffmpeg. No frame is kept
+# once encoded. Without ffmpeg the frames are written as numbered PNGs.
+
+# --- CONFIGURATION ---
+SECONDS = 60
+FPS = 30
+STEPS_PER_FRAME = 10  # Steps of every trail drawn per frame
+WIDTH, HEIGHT = 720, 720
+DPI = 100
+
+# --- 1. INTEGRATOR STAGE (own process) ---
+_dream = {} # The running stream of the current day, in the integrator process
+
+def dream_chunk(ordinal, frame):
+    if _dream.get("ordinal") != ordinal:
+        system, params, starts = lucid_dream.dream_setup(date.fromordinal(ordinal))
+        total = SECONDS * FPS * STEPS_PER_FRAME
+        _dream.update(ordinal=ordinal, last=None,
+                      blocks=system.stream(starts, total, params, STEPS_PER_FRAME))
+
+    block = next(_dream["blocks"])
+    if _dream["last"] is None:
+        _dream["last"], block = block[:, 0], block[:, 1:] # The start point isn't a step
+    elif len(block) != len(_dream["last"]):
+        _dream["last"] = block[:, 0] # A trail blew up and was dropped by the stream
+
+    # Color shift (Mood): how fast the dream moves at each point
+    path = np.concatenate([_dream["last"][:, None], block], axis=1)
+    speed = np.linalg.norm(np.diff(path, axis=1), axis=2)
+    _dream["last"] = block[:, -1].copy()
+    return {"points": block.reshape(-1, 3), "speed": speed.ravel()}
+
+# --- 2. ENCODER ---
+class FrameSequenceWriter:
+    # Stand-in for FFMpegWriter: same saving()/grab_frame() use, one PNG per frame
+    def __init__(self, fps):
+        self.fps = fps
+
+    def saving(self, fig, outfile, dpi):
+        self.fig, self.dpi, self.count = fig, dpi, 0
+        self.folder = os.path.splitext(outfile)[0]
+        self.outfile = self.folder # What was written, as MovieWriter.outfile
+        os.makedirs(self.folder, exist_ok=True)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def grab_frame(self):
+        self.fig.savefig(os.path.join(self.folder, f"frame_{self.count:05d}.png"), dpi=self.dpi)
+        self.count += 1
+
+def video_writer(fps):
+    if animation.writers.is_available('ffmpeg'):
+        return animation.FFMpegWriter(fps=fps, codec='h264', extra_args=['-pix_fmt', 'yuv420p'])
+    print("ffmpeg not found: writing the dream as a PNG sequence")
+    return FrameSequenceWriter(fps)
+
+# --- 3. RENDERER STAGE ---
+def animate_dream(day=None):
+    day = day or datetime.now().date()
+    system, params, starts = lucid_dream.dream_setup(day)
+    frames = SECONDS * FPS
+    os.makedirs(lucid_dream.JOURNAL, exist_ok=True)
+    filename = os.path.join(lucid_dream.JOURNAL, f"dream_{day.isoformat()}.mp4")
+
+    fig = plt.figure(figsize=(WIDTH / DPI, HEIGHT / DPI), dpi=DPI)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.axis('off')
+    canvas = ax.imshow(np.zeros((HEIGHT, WIDTH, 3)), interpolation='nearest')
+    heads = ax.scatter([], [], c='white', s=1, alpha=0.8, linewidths=0)
+    ax.set_xlim(-0.5, WIDTH - 0.5)
+    ax.set_ylim(HEIGHT - 0.5, -0.5)
+
+    rows = lucid_dream.TRAJECTORIES * STEPS_PER_FRAME
+    fields = {"points": ((rows, 3), np.float64), "speed": ((rows,), np.float64)}
+    fast = None
+    writer = video_writer(FPS)
+    began = time.perf_counter()
+    # The integrator process is started before this one runs any compiled
+    # kernel: forking after numba's thread pool is up can deadlock
+    with FramePipeline(partial(dream_chunk, day.toordinal()), fields, range(frames)) as pipeline, \
+         writer.saving(fig, filename, DPI):
+        # Framed like the still: on a sample of the whole run
+        camera = lucid_dream.dream_camera(system, params, starts, frames * STEPS_PER_FRAME, WIDTH, HEIGHT)
+        image = DensityImage(WIDTH, HEIGHT, camera)
+
+        for frame, chunk in pipeline:
+            points = chunk["points"]
+            if fast is None:
+                fast = np.percentile(chunk["speed"], 99)
+            image.add(points, chunk["speed"] / fast)
+
+            # Trail heads: where every dream is right now
+            h = points.reshape(-1, STEPS_PER_FRAME, 3)[:, -1] @ camera[:, :3].T + camera[:, 3]
+            heads.set_offsets(h[:, :2] / h[:, 2:])
+
+            canvas.set_data(image.tone_map('jet'))
+            writer.grab_frame()
+    plt.close(fig)
+    filename = writer.outfile # The .mp4, or the folder of PNGs without ffmpeg
+    print(f"Dream filmed: {filename} ({system.name}, {frames} frames, {image.total} points) "
+          f"in {time.perf_counter() - began:.0f}s")
+    return filename
+
+if __name__ == "__main__":
+    # python dream_video.py [YYYY-MM-DD]
+    animate_dream(date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else None)
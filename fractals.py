@@ -0,0 +1,158 @@
+import numpy as np
+from frame_rng import frame_rng
+from kernels import (escape_loop, escape_time, distance_estimate,
+                     mandelbulb_step, mandelbox_step, quaternion_step)
+
+# --- MANDELBULB MATH ---
+# Shared by The Living Mandelbulb and anything that needs the fractal
+# without a figure (worker processes, exporters). No matplotlib here.
+
+def mandelbulb_power(frame):
+    # Dynamic Power: Breathing from 2 (Simple) to 8 (Complex)
+    return 2.0 + (np.sin(frame * 0.05) + 1.0) * 3.0
+
+def mandelbulb_sdf(x, y, z, power, max_iter=8, bailout=2.0):
+    # Distance Estimator for Mandelbulb
+    # We iterate z -> z^p + c and track the running derivative dr,
+    # then DE = 0.5 * log(r) * r / dr (a lower bound on the distance to the surface).
+    # Works on whole arrays of points (compiled when numba is around).
+    x, y, z = np.broadcast_arrays(x, y, z)
+    d = distance_estimate(x.ravel(), y.ravel(), z.ravel(), power, max_iter, bailout)
+    return d.reshape(x.shape)
+
+# --- GENERATE CLOUD POINT ---
+# Since raymarching is hard in Matplotlib, we generate a point cloud
+# representing the surface of the chaos.
+
+def sample_ball(frame, sample_count, seed=0, radius=1.2):
+    # Spherical Shell sampling (Optimization)
+    # Samples come from this frame's own stream, not the global state
+    rng = frame_rng("mandelbulb", seed, frame)
+    phi = rng.uniform(0, np.pi, sample_count)
+    theta = rng.uniform(0, 2*np.pi, sample_count)
+    rad = rng.uniform(0, radius, sample_count)
+    
+    sx = rad * np.sin(phi) * np.cos(theta)
+    sy = rad * np.sin(phi) * np.sin(theta)
+    sz = rad * np.cos(phi)
+    return sx, sy, sz
+
+def generate_mandelbulb_points(frame, sample_count=2000, seed=0):
+    p = mandelbulb_power(frame)
+    
+    # We are looking for points where the fractal exists (radius < 2 after iterations)
+    # Simplified approach for speed: Iterative Geometry Check
+    
+    # Scan a subset of points to keep animation fast
+    # We use a Monte Carlo approach to fill the volume
+    
+    sx, sy, sz = sample_ball(frame, sample_count, seed)
+    
+    # Iterate and check divergence
+    # (compiled when numba is around, otherwise a vectorized loop that
+    # compacts the survivors each pass, so 10^6 samples stay affordable)
+    cx, cy, cz = sx, sy, sz
+    iterations = escape_time(cx, cy, cz, p, max_iter=8)
+
+    # Filter points that stayed inside (The Fractal Body)
+    # Or points that survived at least a few iterations (The Halo)
+    survivors = iterations > 3
+    
+    final_x = cx[survivors]
+    final_y = cy[survivors]
+    final_z = cz[survivors]
+    final_it = iterations[survivors]
+    
+    return final_x, final_y, final_z, final_it
+
+# --- SURFACE SAMPLING (Distance Estimator) ---
+# Uniform samples mostly land in empty space or deep inside.
+# Instead, fire a batch of rays at the bulb and sphere-trace each one with
+# the distance estimator until it touches the boundary: every hit is a
+# point on the skin of the fractal.
+
+def sample_surface(frame, ray_count, seed=0, power=None, max_steps=48, eps=2e-3, far=3.0):
+    p = mandelbulb_power(frame) if power is None else power
+    rng = frame_rng("mandelbulb-surface", seed, frame)
+    
+    # Rays start on a sphere around the bulb and aim at random points near the core
+    origin = rng.normal(0, 1, (ray_count, 3))
+    origin *= 1.5 / np.linalg.norm(origin, axis=1, keepdims=True)
+    target = rng.normal(0, 0.35, (ray_count, 3))
+    direction = target - origin
+    direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+    
+    idx = np.arange(ray_count)
+    t = np.zeros(ray_count)
+    pos = origin.copy()
+    hits = np.zeros(ray_count, dtype=bool)
+    
+    for step in range(max_steps):
+        d = mandelbulb_sdf(pos[:, 0], pos[:, 1], pos[:, 2], p)
+        hit = d < eps
+        hits[idx[hit]] = True
+        
+        # Keep marching the rays that are still in flight
+        flying = ~hit & (t < far)
+        idx, pos, t, d, ray = idx[flying], pos[flying], t[flying], d[flying], direction[idx[flying]]
+        if len(idx) == 0: break
+        t += d
+        pos += ray * d[:, None]
+        origin[idx] = pos
+    
+    # origin[] now holds where each ray stopped
+    surface = origin[hits]
+    radius = np.linalg.norm(surface, axis=1)
+    
+    # Depth stands in for iterations: outer skin = Violet, deep folds = Cyan
+    span = max(radius.max() - radius.min(), 1e-9) if len(radius) else 1.0
+    it = 8.0 * (radius.max() - radius) / span if len(radius) else radius
+    return surface[:, 0], surface[:, 1], surface[:, 2], it
+
+# --- FRACTAL REGISTRY ---
+# Every fractal is just its per-step transform plus a few numbers; sampling,
+# the escape loop (compiled or compacting numpy) and colouring are shared.
+# To add one: write a step with the signature of kernels.mandelbulb_step
+# and register it below (steps listed in kernels.BUILTIN_STEPS also get a
+# compiled loop cached on disk; any other step compiles once per process).
+
+class Fractal:
+    def __init__(self, name, step, extent, params=lambda frame: (), julia=None,
+                 max_iter=8, bailout=2.0, halo=3, interior=True):
+        self.name = name
+        self.step = step
+        self.extent = extent     # Samples come from the ball of this radius
+        self.params = params     # frame -> the step's params (lets a fractal breathe)
+        self.julia = julia       # Fixed c (Julia-style), or None (Mandelbrot-style)
+        self.max_iter = max_iter
+        self.bailout = bailout
+        self.halo = halo         # Points that survive more than this many iterations are drawn
+        self.interior = interior # False: drop points that never escape (solid fractals hide their skin)
+
+    def escape_time(self, x, y, z, frame=0):
+        return escape_loop(self.step, x, y, z, self.params(frame), self.julia,
+                           self.max_iter, self.bailout)
+
+    def points(self, frame, sample_count=2000, seed=0):
+        """Surviving samples scaled into the radius-1.2 scene, iterations on the 0-8 colour scale."""
+        sx, sy, sz = sample_ball(frame, sample_count, seed, self.extent)
+        it = self.escape_time(sx, sy, sz, frame)
+        survivors = it > self.halo
+        if not self.interior:
+            survivors &= it < self.max_iter
+        scale = 1.2 / self.extent
+        return (sx[survivors] * scale, sy[survivors] * scale, sz[survivors] * scale,
+                it[survivors] * (8.0 / self.max_iter))
+
+FRACTALS = {}
+
+def register(fractal):
+    FRACTALS[fractal.name] = fractal
+    return fractal
+
+register(Fractal("mandelbulb", mandelbulb_step, 1.2, lambda frame: (mandelbulb_power(frame),)))
+register(Fractal("juliabulb", mandelbulb_step, 1.4, lambda frame: (mandelbulb_power(frame),),
+                 julia=(0.0, -0.75, 0.5, 0.0)))
+register(Fractal("mandelbox", mandelbox_step, 6.0, lambda frame: (2.0, 0.25, 1.0),
+                 max_iter=16, bailout=100.0, halo=12, interior=False))
+register(Fractal("quaternion_julia", quaternion_step, 1.6, julia=(-0.2, 0.8, 0.0, 0.0)))
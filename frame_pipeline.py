@@ -0,0 +1,155 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from contextlib import contextmanager
+import numpy as np
+
+# --- SIMULATION / RENDER PIPELINE ---
+# Two stages in two processes, overlapping in time:
+#
+#   [simulate(frame)] --writes--> ring of N shared-memory slots --reads--> [render]
+#
+# The simulation process fills slots while the renderer draws the previous
+# ones. The renderer gets numpy views straight into shared memory (no copies).
+# Backpressure: the simulator blocks when all N slots are full, so memory is
+# bounded by the ring size no matter how far ahead the simulation could run.
+#
+# `fields` describes one slot: {name: (max_shape, dtype)}. A frame may fill
+# fewer rows than max_shape[0]; the row count travels with the slot.
+# `simulate(frame)` returns {name: array} and must be importable (module level)
+# so it can be sent to the simulation process.
+
+HEADER_FIELDS = 2 # [frame, rows]
+
+def _slot_layout(fields, slots):
+    layout = {}
+    offset = 0
+    for name, (shape, dtype) in fields.items():
+        dtype = np.dtype(dtype)
+        shape = (slots,) + tuple(shape)
+        layout[name] = (offset, shape, dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        offset += (nbytes + 63) // 64 * 64 # Cache-line aligned
+    layout["_header"] = (offset, (slots, HEADER_FIELDS), np.dtype(np.int64))
+    offset += slots * HEADER_FIELDS * 8
+    return layout, offset
+
+def _attach(shm, layout):
+    return {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, (offset, shape, dtype) in layout.items()}
+
+def _simulation_stage(shm_name, layout, slots, simulate, frames, repeat, free, filled, stop):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = _attach(shm, layout)
+    header = ring["_header"]
+    try:
+        seq = 0
+        while not stop.is_set():
+            for frame in frames:
+                state = simulate(frame)
+
+                # Backpressure: wait for the renderer to hand a slot back
+                while not free.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                slot = seq % slots
+                rows = 0
+                for name, arr in state.items():
+                    arr = np.asarray(arr)
+                    rows = len(arr)
+                    ring[name][slot, :rows] = arr
+                header[slot] = (frame, rows)
+                filled.release()
+                seq += 1
+            if not repeat:
+                break
+        # End of stream marker
+        while not free.acquire(timeout=0.1):
+            if stop.is_set():
+                return
+        header[seq % slots] = (-1, 0)
+        filled.release()
+    finally:
+        # Views must go before the mapping can close
+        del ring, header
+        shm.close()
+
+class FramePipeline:
+    def __init__(self, simulate, fields, frames, slots=4, repeat=False, start_method=None):
+        self.slots = int(slots)
+        self.layout, nbytes = _slot_layout(fields, self.slots)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        self.ring = _attach(self.shm, self.layout)
+        self.header = self.ring["_header"]
+        self.seq = 0
+        self.done = False
+
+        # Forking after numba's thread pool is up can hang this process at exit:
+        # start the pipeline before any compiled kernel runs, or pass 'spawn'
+        ctx = mp.get_context(start_method)
+        self.free = ctx.Semaphore(self.slots)
+        self.filled = ctx.Semaphore(0)
+        self.stop = ctx.Event()
+        self.process = ctx.Process(
+            target=_simulation_stage,
+            args=(self.shm.name, self.layout, self.slots, simulate, list(frames), repeat,
+                  self.free, self.filled, self.stop),
+            daemon=True)
+        self.process.start()
+
+    @contextmanager
+    def frame(self):
+        """Yields (frame, {name: view}) for the next simulated frame, or (None, None)
+        at the end of the stream. The slot is handed back on exit, so don't keep the views.
+
+        Raises RuntimeError if the simulation process died before sending the
+        frame; the stream has ended after that, so later calls yield (None, None).
+        """
+        if self.done:
+            yield None, None
+            return
+        self._wait_filled()
+        slot = self.seq % self.slots
+        frame, rows = (int(v) for v in self.header[slot])
+        try:
+            if frame < 0:
+                self.done = True
+                yield None, None
+            else:
+                yield frame, {name: arr[slot, :rows] for name, arr in self.ring.items()
+                              if name != "_header"}
+        finally:
+            self.seq += 1
+            self.free.release()
+
+    def _wait_filled(self):
+        # A simulator that crashed (or was killed) never releases the slot
+        while not self.filled.acquire(timeout=0.1):
+            if not self.process.is_alive():
+                # It may have sent the frame just before exiting
+                if self.filled.acquire(block=False):
+                    return
+                self.done = True
+                raise RuntimeError(f"Simulation process exited with code {self.process.exitcode} "
+                                   f"after sending {self.seq} frames")
+
+    def __iter__(self):
+        while True:
+            with self.frame() as (frame, state):
+                if frame is None:
+                    return
+                yield frame, state
+
+    def close(self):
+        self.stop.set()
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.ring = self.header = None
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,34 @@
+import zlib
+import numpy as np
+
+# --- DETERMINISTIC FRAME STREAMS ---
+# Every frame of every scene gets its own independent Generator.
+# The stream depends only on (scene, seed, frame), never on call order,
+# so any frame renders bit-identically in any worker process.
+#
+#   root  = SeedSequence([seed, crc32(scene)])
+#   frame = root.spawn(...)[frame]
+#
+# Spawning child N directly via its spawn_key is exactly what
+# SeedSequence.spawn() does, without materialising the N earlier children.
+
+def scene_entropy(scene, seed=0):
+    """Entropy words for a scene. crc32 is stable across runs (unlike hash())."""
+    return [int(seed) & 0xFFFFFFFF, zlib.crc32(str(scene).encode("utf-8"))]
+
+def scene_sequence(scene, seed=0):
+    """Root SeedSequence of a scene; children are its frames."""
+    return np.random.SeedSequence(scene_entropy(scene, seed))
+
+def frame_sequence(scene, seed, frame):
+    """The SeedSequence child for one frame (same as scene_sequence(...).spawn(frame + 1)[-1])."""
+    root = scene_sequence(scene, seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (int(frame),))
+
+def frame_rng(scene, seed, frame):
+    """Independent Generator for one frame of one scene."""
+    return np.random.default_rng(frame_sequence(scene, seed, frame))
+
+def frame_key(scene, seed, frame):
+    """Stable key for caching a rendered frame."""
+    return f"{scene}-{int(seed)}-{int(frame):06d}"
@@ -0,0 +1,137 @@
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib.image as mpimg
+
+# --- DREAM GALLERY ---
+# Turns the dream journal into something browsable without opening a year of
+# full-size PNGs:
+#
+#   dreams/manifest.json   every dream: size, mtime, sha1 of its bytes, thumbnail
+#   dreams/thumbs/         small copies, made once per content hash
+#   dreams/index.json      the catalogue, newest first
+#   dreams/index.html      a static contact sheet linking to the full images
+#
+# Incremental: a file whose size and mtime match the manifest is trusted
+# without being read; a touched file is re-hashed and only gets a new
+# thumbnail if its bytes really changed. An unchanged journal is one
+# directory listing and no writes.
+
+JOURNAL = "dreams"
+THUMB_SIZE = 160 # Longest edge, in pixels
+WORKERS = os.cpu_count()
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def make_thumbnail(task):
+    """Box-filters an image down to THUMB_SIZE and saves it (one task per image)."""
+    src, dst, size = task
+    image = mpimg.imread(src)
+    factor = max(1, -(-max(image.shape[:2]) // size)) # Ceiling division
+    h, w = (image.shape[0] // factor) * factor, (image.shape[1] // factor) * factor
+    small = image[:h, :w].reshape(h // factor, factor, w // factor, factor, -1).mean(axis=(1, 3))
+    tmp = f"{dst}.{os.getpid()}.part"
+    mpimg.imsave(tmp, np.clip(small, 0.0, 1.0), format='png')
+    os.replace(tmp, dst)
+    return dst
+
+def write_atomic(path, text):
+    tmp = f"{path}.{os.getpid()}.part"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def load_manifest(journal):
+    try:
+        with open(os.path.join(journal, "manifest.json"), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def scan(journal, manifest):
+    """The new manifest, plus the entries whose thumbnail must be (re)made."""
+    current, todo = {}, []
+    with os.scandir(journal) as entries:
+        for entry in entries:
+            if not (entry.name.startswith("dream_") and entry.name.endswith(".png")):
+                continue
+            stat = entry.stat()
+            old = manifest.get(entry.name)
+            if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+                record = old # Untouched since last time: trust it
+            else:
+                digest = file_hash(entry.path)
+                record = {"date": entry.name[len("dream_"):-len(".png")], "size": stat.st_size,
+                          "mtime_ns": stat.st_mtime_ns, "sha1": digest,
+                          "thumb": f"thumbs/{digest[:16]}.png"}
+            if not os.path.exists(os.path.join(journal, record["thumb"])):
+                todo.append((entry.name, record))
+            current[entry.name] = record
+    return current, todo
+
+def render_index(journal, manifest):
+    dreams = sorted(manifest.items(), key=lambda item: item[1]["date"], reverse=True)
+    catalogue = [{"date": r["date"], "image": name, "thumb": r["thumb"], "sha1": r["sha1"]}
+                 for name, r in dreams]
+    write_atomic(os.path.join(journal, "index.json"), json.dumps(catalogue, indent=1))
+
+    cells = "\n".join(
+        f'<a href="{html.escape(c["image"])}"><figure><img src="{html.escape(c["thumb"])}" '
+        f'loading="lazy" alt="{c["date"]}"><figcaption>{c["date"]}</figcaption></figure></a>'
+        for c in catalogue)
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Dodeca's Dreams</title>
+<style>
+body {{ background: #000; color: #aaa; font-family: monospace; }}
+main {{ display: flex; flex-wrap: wrap; gap: 8px; }}
+figure {{ margin: 0; text-align: center; }}
+img {{ width: {THUMB_SIZE}px; height: {THUMB_SIZE}px; object-fit: contain; }}
+a {{ color: inherit; text-decoration: none; }}
+</style></head>
+<body><h1>DREAM JOURNAL ({len(catalogue)} dreams)</h1>
+<main>
+{cells}
+</main></body></html>
+"""
+    write_atomic(os.path.join(journal, "index.html"), page)
+
+def build_gallery(journal=JOURNAL, workers=WORKERS):
+    """Brings manifest, thumbnails and index up to date; returns how many thumbnails were made."""
+    os.makedirs(os.path.join(journal, "thumbs"), exist_ok=True)
+    manifest = load_manifest(journal)
+    current, todo = scan(journal, manifest)
+
+    tasks = [(os.path.join(journal, name), os.path.join(journal, r["thumb"]), THUMB_SIZE) for name, r in todo]
+    if len(tasks) > 1 and (workers is None or workers > 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(make_thumbnail, tasks, chunksize=8))
+    else:
+        for task in tasks:
+            make_thumbnail(task)
+
+    if current != manifest or todo:
+        # Thumbnails nobody points to any more (deleted or changed dreams)
+        live = {r["thumb"] for r in current.values()}
+        for r in manifest.values():
+            path = os.path.join(journal, r["thumb"])
+            if r["thumb"] not in live and os.path.exists(path):
+                os.remove(path)
+        write_atomic(os.path.join(journal, "manifest.json"), json.dumps(current, indent=1, sort_keys=True))
+        render_index(journal, current)
+    return len(tasks)
+
+if __name__ == "__main__":
+    journal = sys.argv[1] if len(sys.argv) > 1 else JOURNAL
+    start = time.perf_counter()
+    made = build_gallery(journal)
+    print(f"Gallery: {made} new thumbnails in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,62 @@
+import hashlib
+import inspect
+import json
+import os
+import numpy as np
+
+# --- GEOMETRY CACHE ---
+# Anything a scene precomputes at launch (fractal grids, voxel bodies, pose
+# clips) is stored once under cache/ as .npy, named by a hash of the
+# parameters and the generator that produced it:
+#
+#   cache/<name>-<sha1(params, generator names, generator sources)[:16]>.npy
+#
+# Later launches memory-map the file instead of recomputing: nothing is read
+# until it is touched, and processes share the same pages.
+# Change any parameter or edit a listed generator and the key changes with it.
+# Only the listed functions are hashed: name every one whose code decides the
+# contents (the builder and what it calls), or bump CACHE_VERSION. Anything
+# that bakes in milliseconds is cheaper left uncached.
+
+CACHE_DIR = "cache"
+CACHE_VERSION = 1
+
+def generator_key(generator):
+    """Qualified name and source hash of the function that produces a cached array."""
+    try:
+        source = inspect.getsource(generator)
+    except (OSError, TypeError): # Defined at the prompt: the name is all there is
+        source = ""
+    return {"generator": f"{generator.__module__}.{generator.__qualname__}",
+            "source": hashlib.sha1(source.encode()).hexdigest()}
+
+def cache_path(name, params, generator=None):
+    key = {"v": CACHE_VERSION, **params}
+    if generator is not None:
+        generators = generator if isinstance(generator, tuple) else (generator,)
+        key["_generator"] = [generator_key(g) for g in generators]
+    blob = json.dumps(key, sort_keys=True, default=repr)
+    digest = hashlib.sha1(blob.encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{name}-{digest}.npy")
+
+def cached_file(name, params, write, generator=None):
+    """Memory-mapped array for (name, params); `write(path)` saves the .npy on a miss.
+
+    The key also covers `generator` (default: `write`): the function, or tuple
+    of functions, whose code decides the contents. Pass it when `write` is only
+    a wrapper, and list the functions the builder calls.
+    """
+    path = cache_path(name, params, generator or write)
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.part"
+        write(tmp)
+        os.replace(tmp, path) # Readers never see a half-written file
+    return np.load(path, mmap_mode='r')
+
+def cached_array(name, params, build, generator=None):
+    """Same, for generators that return the whole array (`generator` defaults to `build`)."""
+    def write(path):
+        with open(path, 'wb') as f:
+            np.save(f, build())
+    return cached_file(name, params, write, generator or build)
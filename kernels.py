@@ -0,0 +1,558 @@
+import os
+import numpy as np
+
+# --- COMPILED KERNELS (optional) ---
+# The hot loops that can't be vectorized cleanly (per-element early exit,
+# step-by-step integration, stateful particles). When numba is installed
+# they run as parallel machine code; when it isn't, the numpy versions
+# below run instead and give the same numbers.
+#
+# Compiled kernels are cached to disk (__pycache__), so only the very
+# first launch pays for compilation.
+# Set DODECA_NUMBA=0 to force the numpy path.
+
+try:
+    if os.environ.get("DODECA_NUMBA", "1") == "0":
+        raise ImportError
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# --- 0. FRACTAL STEPS ---
+# One iteration of a fractal's map, written once for both paths: on whole
+# arrays it runs as numpy, and numba compiles the very same function for
+# scalars. State is (x, y, z, w) (w stays 0 for 3D fractals), c is the
+# constant of the map and params the fractal's own numbers.
+# The escape loop below is shared by every fractal in fractals.FRACTALS.
+
+def mandelbulb_step(x, y, z, w, cx, cy, cz, cw, params):
+    # z -> z^p + c in spherical coordinates
+    power = params[0]
+    r = np.sqrt(x*x + y*y + z*z)
+    theta = np.arctan2(np.sqrt(x*x + y*y), z) * power
+    phi = np.arctan2(y, x) * power
+    zr = r ** power
+    sin_t = zr * np.sin(theta)
+    return sin_t * np.cos(phi) + cx, sin_t * np.sin(phi) + cy, zr * np.cos(theta) + cz, w
+
+def mandelbox_step(x, y, z, w, cx, cy, cz, cw, params):
+    # Box fold, sphere fold, scale: z -> scale * fold(z) + c
+    scale, min_r2, fixed_r2 = params[0], params[1], params[2]
+    x = np.minimum(np.maximum(x, -1.0), 1.0) * 2.0 - x
+    y = np.minimum(np.maximum(y, -1.0), 1.0) * 2.0 - y
+    z = np.minimum(np.maximum(z, -1.0), 1.0) * 2.0 - z
+    r2 = x*x + y*y + z*z
+    k = scale * fixed_r2 / np.minimum(np.maximum(r2, min_r2), fixed_r2)
+    return x*k + cx, y*k + cy, z*k + cz, w
+
+def quaternion_step(x, y, z, w, cx, cy, cz, cw, params):
+    # q -> q^2 + c, q = x + yi + zj + wk (drawn as the w = 0 slice)
+    return x*x - y*y - z*z - w*w + cx, 2.0*x*y + cy, 2.0*x*z + cz, 2.0*x*w + cw
+
+# --- 0b. FLOWS ---
+# Same idea for continuous systems: a derivative written once, vectorized
+# over the columns of an (M, 3) ensemble or compiled for one trajectory.
+
+def lorenz_derivative(x, y, z, params):
+    s, r, b = params[0], params[1], params[2]
+    return s*(y - x), r*x - y - x*z, x*y - b*z
+
+def rossler_derivative(x, y, z, params):
+    a, b, c = params[0], params[1], params[2]
+    return -y - z, x + a*y, b + z*(x - c)
+
+def aizawa_derivative(x, y, z, params):
+    a, b, c, d, e, f = params[0], params[1], params[2], params[3], params[4], params[5]
+    return ((z - b)*x - d*y,
+            d*x + (z - b)*y,
+            c + a*z - z*z*z/3.0 - (x*x + y*y)*(1.0 + e*z) + f*z*x*x*x)
+
+def thomas_derivative(x, y, z, params):
+    b = params[0]
+    return np.sin(y) - b*x, np.sin(z) - b*y, np.sin(x) - b*z
+
+def halvorsen_derivative(x, y, z, params):
+    a = params[0]
+    return -a*x - 4.0*y - 4.0*z - y*y, -a*y - 4.0*z - 4.0*x - z*z, -a*z - 4.0*x - 4.0*y - x*x
+
+def chen_derivative(x, y, z, params):
+    a, b, c = params[0], params[1], params[2]
+    return a*(y - x), (c - a)*x - x*z + c*y, x*y - b*z
+
+# The built-in steps and flows get compiled loops cached on disk (numba can't
+# cache a loop closed over a function, so these pick theirs by index).
+# Any other step or derivative still works, compiled once per process.
+BUILTIN_STEPS = (mandelbulb_step, mandelbox_step, quaternion_step)
+BUILTIN_DERIVATIVES = (lorenz_derivative, rossler_derivative, aizawa_derivative,
+                       thomas_derivative, halvorsen_derivative, chen_derivative)
+
+# --- 1. NUMPY PATH (always available) ---
+def _escape_loop_numpy(step, px, py, pz, c, julia, params, max_iter, bailout):
+    n = len(px)
+    iterations = np.zeros(n)
+
+    # Active set: indices of the points still inside, plus their state packed
+    # into short contiguous arrays. Diverged points are dropped as they escape,
+    # so every pass only touches survivors.
+    idx = np.arange(n)
+    x, y, z, w = px.copy(), py.copy(), pz.copy(), np.zeros(n)
+    if julia:
+        cx, cy, cz, cw = c # Julia: one constant, the point is the start
+    else:
+        cx, cy, cz, cw = px, py, pz, np.zeros(n) # Mandelbrot: the point is the constant
+
+    for i in range(max_iter):
+        r = np.sqrt(x*x + y*y + z*z + w*w)
+
+        # Compact: keep the points that have not escaped yet
+        keep = ~(r > bailout)
+        if not keep.all():
+            idx, x, y, z, w = idx[keep], x[keep], y[keep], z[keep], w[keep]
+            if not julia:
+                cx, cy, cz, cw = cx[keep], cy[keep], cz[keep], cw[keep]
+        if len(idx) == 0: break
+        iterations[idx] += 1
+
+        x, y, z, w = step(x, y, z, w, cx, cy, cz, cw, params)
+
+    return iterations
+
+def _distance_estimate_numpy(cx, cy, cz, power, max_iter, bailout):
+    R = np.sqrt(cx*cx + cy*cy + cz*cz)
+    DR = np.ones(len(cx))
+
+    # Same active-set compaction as the escape loop, carrying dr along
+    idx = np.arange(len(cx))
+    zx, zy, zz = cx.copy(), cy.copy(), cz.copy()
+    r, dr = R.copy(), DR.copy()
+
+    for i in range(max_iter):
+        keep = r <= bailout
+        if not keep.all():
+            idx, zx, zy, zz, r, dr = idx[keep], zx[keep], zy[keep], zz[keep], r[keep], dr[keep]
+        if len(idx) == 0: break
+
+        dr = np.power(r, power - 1.0) * power * dr + 1.0
+        theta = np.arctan2(np.sqrt(zx*zx + zy*zy), zz) * power
+        phi = np.arctan2(zy, zx) * power
+        zr = np.power(r, power)
+
+        zx = zr * np.sin(theta) * np.cos(phi) + cx[idx]
+        zy = zr * np.sin(theta) * np.sin(phi) + cy[idx]
+        zz = zr * np.cos(theta) + cz[idx]
+
+        r = np.sqrt(zx*zx + zy*zy + zz*zz)
+        R[idx] = r
+        DR[idx] = dr
+
+    R = np.maximum(R, 1e-12) # The origin never escapes; keep log() finite
+    return 0.5 * np.log(R) * R / DR
+
+def _integrate_numpy(derivative, starts, dt, steps, params, out):
+    # Classic RK4 on the whole ensemble at once: every stage is a handful of
+    # array operations over M trajectories, so the Python loop runs `steps`
+    # times no matter how many trajectories there are.
+    x, y, z = starts[:, 0].copy(), starts[:, 1].copy(), starts[:, 2].copy()
+    out[:, 0] = starts
+    half, sixth = dt / 2.0, dt / 6.0
+    # Diverging trails run to inf/NaN like the compiled loop, silently: callers drop or mask them
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(steps):
+            k1x, k1y, k1z = derivative(x, y, z, params)
+            k2x, k2y, k2z = derivative(x + half*k1x, y + half*k1y, z + half*k1z, params)
+            k3x, k3y, k3z = derivative(x + half*k2x, y + half*k2y, z + half*k2z, params)
+            k4x, k4y, k4z = derivative(x + dt*k3x, y + dt*k3y, z + dt*k3z, params)
+            x += sixth * (k1x + 2.0*k2x + 2.0*k3x + k4x)
+            y += sixth * (k1y + 2.0*k2y + 2.0*k3y + k4y)
+            z += sixth * (k1z + 2.0*k2z + 2.0*k3z + k4z)
+            out[:, i + 1, 0] = x
+            out[:, i + 1, 1] = y
+            out[:, i + 1, 2] = z
+    return out
+
+def _step_particles_numpy(pos, vel, age, alive, dt, lifetime, bounds_min, bounds_max):
+    pos[alive] += vel[alive] * dt
+    age[alive] += dt
+    inside = np.all((pos >= bounds_min) & (pos <= bounds_max), axis=1)
+    alive &= inside & (age < lifetime)
+
+def _orbit_particles_numpy(pos, vel, age, alive, dt, gm, horizon, substeps, lifetime, bounds_min, bounds_max):
+    # Leapfrog (kick-drift-kick) in the point-mass potential -gm/r: symplectic,
+    # so orbits neither spiral in nor fly off by integration error alone
+    idx = np.flatnonzero(alive)
+    p, v = pos[idx], vel[idx]
+    h = dt / substeps
+    fell = np.zeros(len(idx), dtype=bool)
+    r = np.maximum(np.linalg.norm(p, axis=1), 0.5 * horizon)
+    a = p * (-gm / (r*r*r))[:, None]
+    for s in range(substeps):
+        v += 0.5 * h * a
+        p += h * v
+        r = np.maximum(np.linalg.norm(p, axis=1), 0.5 * horizon) # Softened: absorbed ones don't blow up
+        fell |= r < horizon
+        a = p * (-gm / (r*r*r))[:, None]
+        v += 0.5 * h * a
+    pos[idx], vel[idx] = p, v
+    age[idx] += dt
+    inside = np.all((p >= bounds_min) & (p <= bounds_max), axis=1)
+    alive[idx] = ~fell & inside & (age[idx] < lifetime)
+
+# Light around a black hole (units of the Schwarzschild radius): in its
+# orbital plane a photon's u = 1/r obeys the Binet equation
+#   u'' = -u + 1.5 u^2      (' = d/dphi)
+# Written once like the fractal steps: arrays here, scalars under numba.
+GEODESIC_STRETCH = 8.0 # Largest step, in units of dphi (far from the hole)
+
+def _binet_rk4(u, v, h):
+    k1u, k1v = v, -u + 1.5*u*u
+    uu = u + 0.5*h*k1u
+    k2u, k2v = v + 0.5*h*k1v, -uu + 1.5*uu*uu
+    uu = u + 0.5*h*k2u
+    k3u, k3v = v + 0.5*h*k2v, -uu + 1.5*uu*uu
+    uu = u + h*k3u
+    k4u, k4v = v + h*k3v, -uu + 1.5*uu*uu
+    return (u + h/6.0 * (k1u + 2.0*k2u + 2.0*k3u + k4u),
+            v + h/6.0 * (k1v + 2.0*k2v + 2.0*k3v + k4v))
+
+def _hermite(ua, va, ub, vb, h, s):
+    # u at fraction s of a step, from both ends' values and slopes
+    s2 = s*s
+    s3 = s2*s
+    return ((2.0*s3 - 3.0*s2 + 1.0)*ua + (s3 - 2.0*s2 + s)*h*va
+            + (3.0*s2 - 2.0*s3)*ub + (s3 - s2)*h*vb)
+
+def _geodesics_numpy(u0, v0, phi_cross, dphi, max_phi, u_cross, phi_end, escaped):
+    # All rays step together; rays leave the batch when they fall in (u >= 1)
+    # or reach infinity (u <= 0). The step is dphi inside r = 3 and grows with
+    # r up to GEODESIC_STRETCH times that: far out the path is almost straight.
+    idx = np.arange(len(u0))
+    u, v = u0.copy(), v0.copy()
+    phi = np.zeros(len(u0))
+    crossed = np.zeros(len(u0), dtype=np.int64)
+    crossings = u_cross.shape[1]
+    while len(idx):
+        h = dphi * np.clip(1.0 / (3.0*u), 1.0, GEODESIC_STRETCH)
+        un, vn = _binet_rk4(u, v, h)
+        # The ray meets the disk plane at phi_cross + k*pi (at most once a step)
+        target = phi_cross[idx] + crossed[idx] * np.pi
+        hit = (target <= phi + h) & (crossed[idx] < crossings)
+        if hit.any():
+            s = (target[hit] - phi[hit]) / h[hit]
+            u_cross[idx[hit], crossed[idx[hit]]] = _hermite(u[hit], v[hit], un[hit], vn[hit], h[hit], s)
+            crossed[idx[hit]] += 1
+
+        phi += h
+        fell, out = un >= 1.0, un <= 0.0
+        phi_end[idx[fell]] = phi[fell]
+        phi_end[idx[out]] = phi[out] - h[out] * un[out] / (un[out] - u[out])
+        escaped[idx[out]] = True
+        # Still circling the photon sphere at max_phi: counted as captured
+        lost = ~(fell | out) & (phi >= max_phi)
+        phi_end[idx[lost]] = phi[lost]
+        keep = ~(fell | out | lost)
+        idx, u, v, phi = idx[keep], un[keep], vn[keep], phi[keep]
+
+# --- 2. NUMBA PATH ---
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _distance_estimate_numba(cx, cy, cz, power, max_iter, bailout):
+        n = len(cx)
+        out = np.empty(n)
+        for k in prange(n):
+            x, y, z = cx[k], cy[k], cz[k]
+            r = np.sqrt(x*x + y*y + z*z)
+            dr = 1.0
+            for i in range(max_iter):
+                if r > bailout: break
+                dr = r ** (power - 1.0) * power * dr + 1.0
+                theta = np.arctan2(np.sqrt(x*x + y*y), z) * power
+                phi = np.arctan2(y, x) * power
+                zr = r ** power
+                x = zr * np.sin(theta) * np.cos(phi) + cx[k]
+                y = zr * np.sin(theta) * np.sin(phi) + cy[k]
+                z = zr * np.cos(theta) + cz[k]
+                r = np.sqrt(x*x + y*y + z*z)
+            r = max(r, 1e-12)
+            out[k] = 0.5 * np.log(r) * r / dr
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _step_particles_numba(pos, vel, age, alive, dt, lifetime, bounds_min, bounds_max):
+        for k in prange(len(pos)):
+            if not alive[k]: continue
+            inside = True
+            for j in range(3):
+                pos[k, j] += vel[k, j] * dt
+                if pos[k, j] < bounds_min[j] or pos[k, j] > bounds_max[j]:
+                    inside = False
+            age[k] += dt
+            alive[k] = inside and age[k] < lifetime
+
+    @njit(parallel=True, cache=True)
+    def _orbit_particles_numba(pos, vel, age, alive, dt, gm, horizon, substeps, lifetime, bounds_min, bounds_max):
+        h = dt / substeps
+        for k in prange(len(pos)):
+            if not alive[k]: continue
+            x, y, z = pos[k, 0], pos[k, 1], pos[k, 2]
+            vx, vy, vz = vel[k, 0], vel[k, 1], vel[k, 2]
+            r = max(np.sqrt(x*x + y*y + z*z), 0.5 * horizon)
+            f = -gm / (r*r*r)
+            ax, ay, az = x*f, y*f, z*f
+            fell = False
+            for s in range(substeps):
+                vx += 0.5 * h * ax
+                vy += 0.5 * h * ay
+                vz += 0.5 * h * az
+                x += h * vx
+                y += h * vy
+                z += h * vz
+                r = max(np.sqrt(x*x + y*y + z*z), 0.5 * horizon)
+                fell = fell or r < horizon
+                f = -gm / (r*r*r)
+                ax, ay, az = x*f, y*f, z*f
+                vx += 0.5 * h * ax
+                vy += 0.5 * h * ay
+                vz += 0.5 * h * az
+            pos[k, 0], pos[k, 1], pos[k, 2] = x, y, z
+            vel[k, 0], vel[k, 1], vel[k, 2] = vx, vy, vz
+            age[k] += dt
+            inside = True
+            for j in range(3):
+                if pos[k, j] < bounds_min[j] or pos[k, j] > bounds_max[j]:
+                    inside = False
+            alive[k] = not fell and inside and age[k] < lifetime
+
+    _binet_rk4_jit = njit(_binet_rk4)
+    _hermite_jit = njit(_hermite)
+
+    @njit(parallel=True, cache=True)
+    def _geodesics_numba(u0, v0, phi_cross, dphi, max_phi, u_cross, phi_end, escaped):
+        crossings = u_cross.shape[1]
+        for k in prange(len(u0)):
+            u, v = u0[k], v0[k]
+            crossed = 0
+            phi = 0.0
+            done = False
+            while phi < max_phi:
+                h = dphi * min(max(1.0 / (3.0*u), 1.0), GEODESIC_STRETCH)
+                un, vn = _binet_rk4_jit(u, v, h)
+                target = phi_cross[k] + crossed * np.pi
+                if target <= phi + h and crossed < crossings:
+                    u_cross[k, crossed] = _hermite_jit(u, v, un, vn, h, (target - phi) / h)
+                    crossed += 1
+                phi += h
+                if un >= 1.0:
+                    phi_end[k] = phi
+                    done = True
+                    break
+                if un <= 0.0:
+                    phi_end[k] = phi - h * un / (un - u)
+                    escaped[k] = True
+                    done = True
+                    break
+                u, v = un, vn
+            if not done:
+                phi_end[k] = phi
+
+    # Built-in steps and flows: one cached loop each family, the function picked by index
+    _step_jits = tuple(njit(cache=True)(step) for step in BUILTIN_STEPS)
+    _mandelbulb_jit, _mandelbox_jit, _quaternion_jit = _step_jits
+    _derivative_jits = tuple(njit(cache=True)(derivative) for derivative in BUILTIN_DERIVATIVES)
+    _lorenz_jit, _rossler_jit, _aizawa_jit, _thomas_jit, _halvorsen_jit, _chen_jit = _derivative_jits
+
+    @njit(cache=True)
+    def _builtin_step(which, x, y, z, w, cx, cy, cz, cw, params):
+        if which == 0:
+            return _mandelbulb_jit(x, y, z, w, cx, cy, cz, cw, params)
+        if which == 1:
+            return _mandelbox_jit(x, y, z, w, cx, cy, cz, cw, params)
+        return _quaternion_jit(x, y, z, w, cx, cy, cz, cw, params)
+
+    @njit(cache=True)
+    def _builtin_derivative(which, x, y, z, params):
+        if which == 0:
+            return _lorenz_jit(x, y, z, params)
+        if which == 1:
+            return _rossler_jit(x, y, z, params)
+        if which == 2:
+            return _aizawa_jit(x, y, z, params)
+        if which == 3:
+            return _thomas_jit(x, y, z, params)
+        if which == 4:
+            return _halvorsen_jit(x, y, z, params)
+        return _chen_jit(x, y, z, params)
+
+    @njit(parallel=True, cache=True)
+    def _escape_loop_builtin(which, px, py, pz, c, julia, params, max_iter, bailout):
+        n = len(px)
+        iterations = np.zeros(n)
+        for k in prange(n):
+            x, y, z, w = px[k], py[k], pz[k], 0.0
+            if julia:
+                cx, cy, cz, cw = c[0], c[1], c[2], c[3]
+            else:
+                cx, cy, cz, cw = x, y, z, 0.0
+            count = 0
+            for i in range(max_iter):
+                r = np.sqrt(x*x + y*y + z*z + w*w)
+                if r > bailout: break
+                count += 1
+                x, y, z, w = _builtin_step(which, x, y, z, w, cx, cy, cz, cw, params)
+            iterations[k] = count
+        return iterations
+
+    @njit(parallel=True, cache=True)
+    def _integrate_builtin(which, starts, dt, steps, params, out):
+        half, sixth = dt / 2.0, dt / 6.0
+        for k in prange(len(starts)):
+            x, y, z = starts[k, 0], starts[k, 1], starts[k, 2]
+            out[k, 0, 0] = x
+            out[k, 0, 1] = y
+            out[k, 0, 2] = z
+            for i in range(steps):
+                k1x, k1y, k1z = _builtin_derivative(which, x, y, z, params)
+                k2x, k2y, k2z = _builtin_derivative(which, x + half*k1x, y + half*k1y, z + half*k1z, params)
+                k3x, k3y, k3z = _builtin_derivative(which, x + half*k2x, y + half*k2y, z + half*k2z, params)
+                k4x, k4y, k4z = _builtin_derivative(which, x + dt*k3x, y + dt*k3y, z + dt*k3z, params)
+                x += sixth * (k1x + 2.0*k2x + 2.0*k3x + k4x)
+                y += sixth * (k1y + 2.0*k2y + 2.0*k3y + k4y)
+                z += sixth * (k1z + 2.0*k2z + 2.0*k3z + k4z)
+                out[k, i + 1, 0] = x
+                out[k, i + 1, 1] = y
+                out[k, i + 1, 2] = z
+        return out
+
+    # Any other step or flow: a loop closed over it, built once per process
+    _escape_loops = {}
+
+    def _escape_loop_numba(step):
+        # One compiled loop per step function, with the step inlined into it
+        if step not in _escape_loops:
+            step_jit = njit(step)
+
+            @njit(parallel=True)
+            def loop(px, py, pz, c, julia, params, max_iter, bailout):
+                n = len(px)
+                iterations = np.zeros(n)
+                for k in prange(n):
+                    x, y, z, w = px[k], py[k], pz[k], 0.0
+                    if julia:
+                        cx, cy, cz, cw = c[0], c[1], c[2], c[3]
+                    else:
+                        cx, cy, cz, cw = x, y, z, 0.0
+                    count = 0
+                    for i in range(max_iter):
+                        r = np.sqrt(x*x + y*y + z*z + w*w)
+                        if r > bailout: break
+                        count += 1
+                        x, y, z, w = step_jit(x, y, z, w, cx, cy, cz, cw, params)
+                    iterations[k] = count
+                return iterations
+
+            _escape_loops[step] = loop
+        return _escape_loops[step]
+
+    _integrators = {}
+
+    def _integrate_numba(derivative):
+        # One trajectory per thread, the derivative inlined (built per process)
+        if derivative not in _integrators:
+            derivative_jit = njit(derivative)
+
+            @njit(parallel=True)
+            def integrate_rk4(starts, dt, steps, params, out):
+                half, sixth = dt / 2.0, dt / 6.0
+                for k in prange(len(starts)):
+                    x, y, z = starts[k, 0], starts[k, 1], starts[k, 2]
+                    out[k, 0, 0] = x
+                    out[k, 0, 1] = y
+                    out[k, 0, 2] = z
+                    for i in range(steps):
+                        k1x, k1y, k1z = derivative_jit(x, y, z, params)
+                        k2x, k2y, k2z = derivative_jit(x + half*k1x, y + half*k1y, z + half*k1z, params)
+                        k3x, k3y, k3z = derivative_jit(x + half*k2x, y + half*k2y, z + half*k2z, params)
+                        k4x, k4y, k4z = derivative_jit(x + dt*k3x, y + dt*k3y, z + dt*k3z, params)
+                        x += sixth * (k1x + 2.0*k2x + 2.0*k3x + k4x)
+                        y += sixth * (k1y + 2.0*k2y + 2.0*k3y + k4y)
+                        z += sixth * (k1z + 2.0*k2z + 2.0*k3z + k4z)
+                        out[k, i + 1, 0] = x
+                        out[k, i + 1, 1] = y
+                        out[k, i + 1, 2] = z
+                return out
+
+            _integrators[derivative] = integrate_rk4
+        return _integrators[derivative]
+
+# --- 3. PUBLIC KERNELS ---
+def escape_loop(step, px, py, pz, params=(), c=None, max_iter=8, bailout=2.0):
+    """Escape-iteration count of each point under any fractal's `step`.
+
+    With c=None the point is the constant (Mandelbrot-style); with a 4-vector c
+    the point is the start and c is fixed (Julia-style).
+    """
+    px, py, pz = (np.ascontiguousarray(a, dtype=np.float64) for a in (px, py, pz))
+    params = np.asarray(params, dtype=np.float64)
+    julia = c is not None
+    c = np.zeros(4) if c is None else np.asarray(c, dtype=np.float64)
+    if HAVE_NUMBA and step in BUILTIN_STEPS:
+        return _escape_loop_builtin(BUILTIN_STEPS.index(step), px, py, pz, c, julia, params,
+                                    int(max_iter), float(bailout))
+    if HAVE_NUMBA:
+        return _escape_loop_numba(step)(px, py, pz, c, julia, params, int(max_iter), float(bailout))
+    return _escape_loop_numpy(step, px, py, pz, c, julia, params, int(max_iter), float(bailout))
+
+def escape_time(cx, cy, cz, power, max_iter=8, bailout=2.0):
+    """Mandelbulb escape-iteration count for each point c = (cx, cy, cz)."""
+    return escape_loop(mandelbulb_step, cx, cy, cz, (power,), None, max_iter, bailout)
+
+def distance_estimate(cx, cy, cz, power, max_iter=8, bailout=2.0):
+    """Mandelbulb distance estimate 0.5 * log(r) * r / dr for each point."""
+    cx, cy, cz = (np.ascontiguousarray(a, dtype=np.float64) for a in (cx, cy, cz))
+    kernel = _distance_estimate_numba if HAVE_NUMBA else _distance_estimate_numpy
+    return kernel(cx, cy, cz, float(power), int(max_iter), float(bailout))
+
+def integrate(derivative, starts, dt=0.01, steps=10000, params=(), out=None):
+    """RK4 trajectories of M starts under `derivative`, written into out (M, steps + 1, 3)."""
+    starts = np.ascontiguousarray(np.atleast_2d(starts), dtype=np.float64)
+    params = np.asarray(params, dtype=np.float64)
+    if out is None:
+        out = np.empty((len(starts), steps + 1, 3))
+    if HAVE_NUMBA and derivative in BUILTIN_DERIVATIVES:
+        return _integrate_builtin(BUILTIN_DERIVATIVES.index(derivative), starts, float(dt), int(steps), params, out)
+    if HAVE_NUMBA:
+        return _integrate_numba(derivative)(starts, float(dt), int(steps), params, out)
+    return _integrate_numpy(derivative, starts, float(dt), int(steps), params, out)
+
+def step_particles(pos, vel, age, alive, dt, lifetime, bounds_min, bounds_max):
+    """Moves and ages live particles in place, culling expired and escaped ones."""
+    kernel = _step_particles_numba if HAVE_NUMBA else _step_particles_numpy
+    kernel(pos, vel, age, alive, float(dt), float(lifetime),
+           np.asarray(bounds_min, dtype=np.float64), np.asarray(bounds_max, dtype=np.float64))
+
+def orbit_particles(pos, vel, age, alive, dt, gm, horizon, substeps, lifetime, bounds_min, bounds_max):
+    """Leapfrogs live particles around a point mass at the origin, in place.
+
+    Particles that pass inside `horizon` are absorbed (die), as are expired
+    and escaped ones.
+    """
+    kernel = _orbit_particles_numba if HAVE_NUMBA else _orbit_particles_numpy
+    kernel(pos, vel, age, alive, float(dt), float(gm), float(horizon), int(substeps), float(lifetime),
+           np.asarray(bounds_min, dtype=np.float64), np.asarray(bounds_max, dtype=np.float64))
+
+def null_geodesics(u0, v0, phi_cross, dphi=0.02, max_phi=6.0 * np.pi, crossings=3):
+    """Traces photons around a Schwarzschild black hole (r in units of r_s).
+
+    Each ray starts at u = 1/r = u0 with du/dphi = v0 and is followed in its
+    orbital plane (RK4 in phi, step dphi near the hole, longer far out).
+    Returns u at its first `crossings` passes through the angles
+    phi_cross + k*pi (NaN if not reached), the angle where it ends, and whether
+    it escaped to infinity (otherwise it fell in).
+    """
+    u0, v0, phi_cross = (np.ascontiguousarray(a, dtype=np.float64) for a in (u0, v0, phi_cross))
+    u_cross = np.full((len(u0), crossings), np.nan)
+    phi_end = np.empty(len(u0))
+    escaped = np.zeros(len(u0), dtype=bool)
+    kernel = _geodesics_numba if HAVE_NUMBA else _geodesics_numpy
+    kernel(u0, v0, phi_cross, float(dphi), float(max_phi), u_cross, phi_end, escaped)
+    return u_cross, phi_end, escaped
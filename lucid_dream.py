@@ -1,59 +1,153 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import os
-from datetime import datetime
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from attractors import attractor_for_date
+from density import DensityImage, frame_points
+from frame_rng import frame_rng
+from gallery import build_gallery
+from trajectory_store import TrajectoryStore
 
 # --- CONFIGURATION ---
-# The dream changes based on the day
-seed = int(datetime.now().timestamp())
-np.random.seed(seed)
+TRAJECTORIES = 1000 # Dreams drift apart: one trail per nearby start (all integrated together)
+STEPS = 10000       # Points per trail (TRAJECTORIES * STEPS points in all, streamed)
+SPREAD = 0.05       # How far apart the starts are (fraction of the system's size)
+WIDTH, HEIGHT = 1000, 1000
+CHUNK_STEPS = 500   # Steps integrated and drawn per block (bounds memory)
+SEED = 0            # The journal's seed: same seed + date -> the same dream, bit for bit
+JOURNAL = "dreams"
+WORKERS = os.cpu_count()
 
-def generate_dream():
-    # Setup the canvas (The Void)
-    plt.figure(figsize=(10, 10))
-    ax = plt.axes(projection='3d')
-    ax.set_facecolor('black')
-    ax.axis('off')
+# The dream changes based on the day:
+# the date is the "frame" of the dream stream, so every day has its own dream
+# and any past one can be dreamt again exactly.
 
+def dream_path(day):
+    # Filename: dream_YYYY-MM-DD.png
+    return os.path.join(JOURNAL, f"dream_{day.isoformat()}.png")
+
+def dream_setup(day):
     # DODECA'S DREAM LOGIC (Strange Attractors)
-    # We generate a chaotic trail
-    def lorenz(x, y, z, s=10, r=28, b=2.667):
-        x_dot = s*(y - x)
-        y_dot = r*x - y - x*z
-        z_dot = x*y - b*z
-        return x_dot, y_dot, z_dot
-
-    dt = 0.01
-    num_steps = 10000
-
-    # Random start position
-    xs = np.empty(num_steps + 1)
-    ys = np.empty(num_steps + 1)
-    zs = np.empty(num_steps + 1)
-    xs[0], ys[0], zs[0] = (np.random.random(3) * 20)
-
-    # Step through the dream
-    for i in range(num_steps):
-        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i])
-        xs[i + 1] = xs[i] + (x_dot * dt)
-        ys[i + 1] = ys[i] + (y_dot * dt)
-        zs[i + 1] = zs[i] + (z_dot * dt)
-
-    # Color shift (Mood)
-    colors = plt.cm.jet(np.linspace(0, 1, num_steps))
+    # Each day dreams of a different system (Lorenz, Rossler, Aizawa, ...)
+    rng = frame_rng("dream", SEED, day.toordinal())
+    system = attractor_for_date(day)
+    params = system.sample_params(rng)
+    starts = system.sample_starts(rng, TRAJECTORIES, SPREAD)
+    return system, params, starts
+
+def dream_camera(system, params, starts, steps, width=None, height=None):
+    # Framed on the whole run, not its first block (a Lorenz ensemble spends
+    # that on one lobe): a few of the trails integrated ahead, strided
+    sample = system.survey(starts, steps, params, chunk=CHUNK_STEPS)
+    return frame_points(sample, width or WIDTH, height or HEIGHT)
+
+def draw_dream(blocks, camera):
+    # A bundle of chaotic trails from a random start, settled onto the attractor,
+    # drawn block by block as (M, n, 3) (The Void is a density image, not a scatter)
+    image = DensityImage(WIDTH, HEIGHT, camera)
+    fast = None
+    for block in blocks:
+        # Color shift (Mood): how fast the dream moves at each point
+        speed = np.linalg.norm(np.diff(block, axis=1, prepend=block[:, :1]), axis=2)
+        if fast is None:
+            fast = np.nanpercentile(speed[:, 1:], 99) # Stored runs keep blown-up trails as NaN
+        image.add(block, speed / fast)
+    return image
 
+def save_dream(image, filename):
     # Draw the memory
-    ax.scatter(xs, ys, zs, c=colors, s=0.5, alpha=0.6)
-    
+    rgb = image.tone_map('jet')
+
+    # Written aside and moved into place, so an interrupted run never leaves
+    # a half-written dream that a backfill would then skip
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmp = f"{filename}.{os.getpid()}.part"
+    plt.imsave(tmp, rgb, format='png')
+    os.replace(tmp, filename)
+
+def generate_dream(day=None):
+    day = day or datetime.now().date()
+    system, params, starts = dream_setup(day)
+
+    # Integrated as it is drawn: nothing but the current block is kept
+    camera = dream_camera(system, params, starts, STEPS)
+    image = draw_dream(system.stream(starts, STEPS, params, CHUNK_STEPS), camera)
+
     # Save the Dream
-    # Ensure folder exists
-    os.makedirs("dreams", exist_ok=True)
-    
-    # Filename: dream_YYYY-MM-DD.png
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    filename = f"dreams/dream_{date_str}.png"
-    plt.savefig(filename, dpi=100, bbox_inches='tight', pad_inches=0)
-    print(f"Dream captured: {filename}")
+    filename = dream_path(day)
+    save_dream(image, filename)
+    print(f"Dream captured: {filename} ({system.name}, {image.total} points)")
+    return filename
+
+# --- LONG DREAMS (Trajectory store) ---
+# The same dream integrated for as long as you like into runs/dream_YYYY-MM-DD/
+# (see trajectory_store.py). Interrupt it and run it again: it resumes where
+# it stopped. Drawing reads the store back, so a long dream can be redrawn
+# without integrating it again.
+
+def run_path(day):
+    return os.path.join(JOURNAL, "runs", f"dream_{day.isoformat()}")
+
+def record_dream(day, steps):
+    system, params, starts = dream_setup(day)
+    began = time.perf_counter()
+    store = system.record(run_path(day), starts, steps, params, CHUNK_STEPS)
+    print(f"Dream recorded: {run_path(day)} ({system.name}, {len(store)} steps) "
+          f"in {time.perf_counter() - began:.1f}s")
+    return store
+
+def redraw_dream(day, t0=0.0, t1=None):
+    """Draws the recorded dream (or the time window [t0, t1] of it) from disk."""
+    store = TrajectoryStore(run_path(day))
+    start, stop = store.step_range(t0, t1)
+    # Framed on frames strided over the whole window, read straight from the store
+    survey = store.read(start, stop, max(1, (stop - start) // 64)).reshape(-1, 3)
+    camera = frame_points(survey.astype(np.float64), WIDTH, HEIGHT)
+    blocks = (frames.transpose(1, 0, 2) for frames in store.blocks(start, stop))
+    image = draw_dream(blocks, camera)
+    filename = os.path.join(run_path(day), "dream.png")
+    save_dream(image, filename)
+    print(f"Dream redrawn: {filename} ({store.meta['system']}, {image.total} points)")
+    return filename
+
+# --- JOURNAL (Backfill) ---
+def _single_threaded():
+    # Each worker dreams one day at a time; the pool provides the parallelism
+    from kernels import HAVE_NUMBA
+    if HAVE_NUMBA:
+        import numba
+        numba.set_num_threads(1)
+
+def missing_days(start, end):
+    days = (start + timedelta(days=i) for i in range((end - start).days + 1))
+    return [day for day in days if not os.path.exists(dream_path(day))]
+
+def backfill(start, end, workers=WORKERS):
+    """Dreams every day from start to end (inclusive) that isn't in the journal yet."""
+    todo = missing_days(start, end)
+    if workers is None or workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_single_threaded) as pool:
+            return list(pool.map(generate_dream, todo))
+    return [generate_dream(day) for day in todo]
 
 if __name__ == "__main__":
-    generate_dream()
\ No newline at end of file
+    # python lucid_dream.py                        -> today's dream
+    # python lucid_dream.py 2025-01-01 [2025-12-31] -> every missing day of the range
+    # python lucid_dream.py --long 2025-01-01 STEPS -> that day's dream, STEPS long, via the store
+    if len(sys.argv) > 1 and sys.argv[1] == "--long":
+        day = date.fromisoformat(sys.argv[2])
+        record_dream(day, int(sys.argv[3]) if len(sys.argv) > 3 else STEPS)
+        redraw_dream(day)
+        sys.exit()
+    if len(sys.argv) > 1:
+        start = date.fromisoformat(sys.argv[1])
+        end = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else datetime.now().date()
+        began = time.perf_counter()
+        written = backfill(start, end)
+        print(f"Journal: {len(written)} dreams written in {time.perf_counter() - began:.1f}s")
+    else:
+        generate_dream()
+    build_gallery(JOURNAL)
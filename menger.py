@@ -0,0 +1,78 @@
+import time
+import numpy as np
+from geometry_cache import cached_array
+
+# --- MENGER SPONGE (Axiom's Structure) ---
+# A level-N sponge is the 20-of-27 pattern applied to itself N times.
+# The cubes are built by index arithmetic, never by recursion:
+#
+#   voxels(N) = 3 * voxels(N-1)  (+)  BASE_OFFSETS     (every pair, Kronecker-style)
+#
+# so level 5 (3.2M cubes) is five vectorized steps. Cubes are stored sparse,
+# as integer coordinates on the 3^N lattice; the dense occupancy grid (one
+# bit per cell when packed) is only built to find the surface.
+
+# The 20 sub-cubes kept out of 27: drop the centre and the six face centres
+_grid = np.indices((3, 3, 3)).reshape(3, -1).T
+BASE_MASK = (_grid == 1).sum(axis=1) < 2
+BASE_OFFSETS = _grid[BASE_MASK].astype(np.int16)
+
+def menger_voxels(level):
+    """Integer coordinates (N, 3) of every cube of a level-`level` sponge (20^level rows)."""
+    dtype = np.int16 if 3**level < 2**15 else np.int32
+    voxels = np.zeros((1, 3), dtype=dtype)
+    for _ in range(level):
+        voxels = (voxels[:, None, :] * 3 + BASE_OFFSETS[None, :, :].astype(dtype)).reshape(-1, 3)
+    return voxels
+
+def menger_occupancy(level):
+    """Dense boolean grid (3^level)^3, via np.kron of the 27-cell mask."""
+    base = BASE_MASK.reshape(3, 3, 3).astype(np.uint8)
+    grid = np.ones((1, 1, 1), dtype=np.uint8)
+    for _ in range(level):
+        grid = np.kron(grid, base)
+    return grid.astype(bool)
+
+def menger_bitset(level):
+    """Occupancy packed 8 cells per byte (level 5: 1.8 MB)."""
+    return np.packbits(menger_occupancy(level))
+
+def _surface_voxels(level):
+    occ = np.pad(menger_occupancy(level), 1)
+    inner = occ[1:-1, 1:-1, 1:-1]
+    buried = inner.copy()
+    for axis in range(3):
+        for shift in (-1, 1):
+            buried &= np.roll(occ, shift, axis=axis)[1:-1, 1:-1, 1:-1]
+    return np.argwhere(inner & ~buried).astype(np.int32)
+
+def surface_voxels(level):
+    """The cubes with at least one open face (the only ones that can be seen), cached on disk."""
+    return cached_array("menger_surface", {"level": level}, lambda: _surface_voxels(level),
+                        (_surface_voxels, menger_occupancy))
+
+def surface_level(budget, max_level=5):
+    """Deepest level whose whole surface fits in `budget` cubes (level 3: 7,544; level 4: 145,688)."""
+    level = 0
+    while level < max_level and len(surface_voxels(level + 1)) <= budget:
+        level += 1
+    return level
+
+def menger_points(level):
+    """Centres of every surface cube, in the unit cube [0, 1]^3.
+
+    Always the whole surface: a random subset of a deeper level erases every
+    hole smaller than its spacing, so a budget picks the level instead
+    (see surface_level).
+    """
+    return (surface_voxels(level) + 0.5) / 3**level
+
+if __name__ == "__main__":
+    for level in range(1, 6):
+        start = time.perf_counter()
+        voxels = menger_voxels(level)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        surface = _surface_voxels(level)
+        print(f"Level {level}: {len(voxels):>9} cubes in {built:.3f}s, "
+              f"{len(surface):>9} on the surface in {time.perf_counter() - start:.3f}s")
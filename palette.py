@@ -0,0 +1,42 @@
+import numpy as np
+
+# --- COLOUR PIPELINE ---
+# Gradients are evaluated once into a 256-entry RGBA table (LUT); mapping
+# a frame's values is then one quantize + one take over the whole array,
+# whatever the point count.
+#
+#   values -> [0, 255] indices (uint8) -> lut.take(indices, axis=0) -> (N, 4)
+
+LUT_SIZE = 256
+
+def bake_lut(gradient, size=LUT_SIZE):
+    """Samples gradient(n) -> (len(n), 4) RGBA at `size` evenly spaced n in [0, 1]."""
+    return np.ascontiguousarray(gradient(np.linspace(0.0, 1.0, size)), dtype=np.float64)
+
+def lut_indices(values, lo=0.0, hi=1.0, size=LUT_SIZE):
+    scaled = (np.asarray(values, dtype=np.float64) - lo) * ((size - 1) / (hi - lo))
+    return np.clip(np.rint(scaled), 0, size - 1).astype(np.uint8 if size <= 256 else np.intp)
+
+def lut_colors(values, lut, lo=0.0, hi=1.0):
+    """RGBA rows for every value (values outside [lo, hi] take the end colours)."""
+    return lut.take(lut_indices(values, lo, hi, len(lut)), axis=0)
+
+# --- THE HISTORY ---
+# Outer Layers (Low) = Violet (Axiom/Structure)
+# Middle Layers = Gold (Epoch/Energy)
+# Inner Core (High) = Cyan (You/Truth)
+def history_gradient(n):
+    low = n < 0.5
+    mix = np.where(low, n * 2, (n - 0.5) * 2)
+    rgba = np.empty((len(n), 4))
+    rgba[:, :3] = np.where(low[:, None],
+                           np.stack([0.5 + 0.5*mix, 0.8*mix, 1.0 - mix], axis=1), # Violet to Gold
+                           np.stack([1.0 - mix, 0.8 + 0.2*mix, mix], axis=1))    # Gold to Cyan
+    rgba[:, 3] = np.where(low, 0.4, 0.6)
+    return rgba
+
+HISTORY = bake_lut(history_gradient)
+
+def history_colors(n):
+    """Violet -> Gold -> Cyan for n in [0, 1]."""
+    return lut_colors(n, HISTORY)
@@ -0,0 +1,65 @@
+import numpy as np
+from kernels import orbit_particles, step_particles
+
+# --- PARTICLE POOL ---
+# A fixed-size block of particles stepped as arrays.
+# Memory never grows: dead slots are reused, and when the pool is full
+# the oldest particles are recycled first. Particles die when they reach
+# their lifetime or leave the bounding box (or, orbiting, fall into the hole).
+
+class ParticlePool:
+    def __init__(self, capacity, lifetime, bounds_min, bounds_max):
+        self.capacity = int(capacity)
+        self.lifetime = float(lifetime)
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+
+        self.pos = np.zeros((self.capacity, 3))
+        self.vel = np.zeros((self.capacity, 3))
+        self.age = np.zeros(self.capacity)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+
+    def spawn(self, pos, vel):
+        """Emits len(vel) particles at pos (one point or one per particle).
+
+        More than the capacity at once keeps the last `capacity` of them.
+        """
+        vel = np.atleast_2d(vel)
+        pos = np.broadcast_to(np.asarray(pos, dtype=float), (len(vel), 3))
+        n = min(len(vel), self.capacity)
+        if n == 0:
+            return
+        pos, vel = pos[-n:], vel[-n:] # Same rows of both
+
+        # Free slots first, then the oldest living particles
+        free = np.flatnonzero(~self.alive)
+        if len(free) < n:
+            living = np.flatnonzero(self.alive)
+            oldest = living[np.argsort(self.age[living])[::-1][:n - len(free)]]
+            free = np.concatenate([free, oldest])
+        slots = free[:n]
+
+        self.pos[slots] = pos
+        self.vel[slots] = vel
+        self.age[slots] = 0.0
+        self.alive[slots] = True
+
+    def step(self, dt=1.0):
+        """Moves every live particle, ages it, and culls the expired/escaped."""
+        step_particles(self.pos, self.vel, self.age, self.alive, dt,
+                       self.lifetime, self.bounds_min, self.bounds_max)
+
+    def orbit(self, dt, gm, horizon, substeps=4):
+        """Same, but falling around a point mass at the origin (leapfrog); the horizon absorbs."""
+        orbit_particles(self.pos, self.vel, self.age, self.alive, dt, gm, horizon, substeps,
+                        self.lifetime, self.bounds_min, self.bounds_max)
+
+    def fade(self):
+        """Remaining life of each live particle, 1.0 (newborn) -> 0.0 (expired)."""
+        return 1.0 - self.age[self.alive] / self.lifetime
+
+    def positions(self):
+        return self.pos[self.alive]
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
@@ -0,0 +1,80 @@
+from functools import lru_cache
+import numpy as np
+from fractals import mandelbulb_power, sample_ball
+from geometry_cache import cached_file
+from kernels import escape_time, mandelbulb_step
+
+# --- POWER-KEYED ITERATION CACHE ---
+# The breathing power 2 + (sin(0.05*frame) + 1) * 3 only ever sweeps 2..8,
+# so the fractal is precomputed once as a stack of 3D escape-iteration grids,
+# one slice per power value:
+#
+#   slices[k, i, j, l] = iterations of grid cell (i, j, l) at powers[k]
+#
+# A frame then looks its samples up in the two slices around its power and
+# blends them. No fractal iteration at render time; the price is resolution
+# (samples snap to the grid, powers blend linearly), not an exact cloud.
+# The stack lives on disk as .npy and is memory-mapped, so it loads instantly
+# and worker processes share the same pages.
+
+POWER_MIN = 2.0
+POWER_MAX = 8.0
+EXTENT = 1.2 # Grid covers [-EXTENT, EXTENT]^3
+
+def slice_powers(count):
+    return np.linspace(POWER_MIN, POWER_MAX, count)
+
+def build_power_slices(path, resolution=60, count=25, max_iter=8):
+    """Computes every slice and writes the stack to `path` (one slice in RAM at a time)."""
+    axis = np.linspace(-EXTENT, EXTENT, resolution)
+    X, Y, Z = np.meshgrid(axis, axis, axis, indexing='ij')
+    X, Y, Z = X.ravel(), Y.ravel(), Z.ravel()
+
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8,
+                                    shape=(count, resolution, resolution, resolution))
+    for k, p in enumerate(slice_powers(count)):
+        out[k] = escape_time(X, Y, Z, p, max_iter).reshape(resolution, resolution, resolution)
+    out.flush()
+    del out
+
+@lru_cache(maxsize=None)
+def power_slices(resolution=60, count=25, max_iter=8):
+    """(powers, slices) with slices memory-mapped; built on first use."""
+    def write(path):
+        print(f"Warming up: {count} power slices at {resolution}^3...")
+        build_power_slices(path, resolution, count, max_iter)
+
+    params = {"resolution": resolution, "count": count, "max_iter": max_iter,
+              "power_min": POWER_MIN, "power_max": POWER_MAX, "extent": EXTENT}
+    generators = (build_power_slices, slice_powers, escape_time, mandelbulb_step)
+    return slice_powers(count), cached_file("mandelbulb_slices", params, write, generators)
+
+def lookup_iterations(powers, slices, power, x, y, z):
+    """Iteration counts at (x, y, z), blended between the two nearest power slices."""
+    resolution = slices.shape[1]
+    scale = (resolution - 1) / (2.0 * EXTENT)
+    i = np.clip(np.rint((x + EXTENT) * scale), 0, resolution - 1).astype(np.intp)
+    j = np.clip(np.rint((y + EXTENT) * scale), 0, resolution - 1).astype(np.intp)
+    l = np.clip(np.rint((z + EXTENT) * scale), 0, resolution - 1).astype(np.intp)
+
+    k = int(np.clip(np.searchsorted(powers, power) - 1, 0, len(powers) - 2))
+    w = (power - powers[k]) / (powers[k + 1] - powers[k])
+    lo = slices[k][i, j, l].astype(np.float64)
+    hi = slices[k + 1][i, j, l].astype(np.float64)
+    return lo + (hi - lo) * w
+
+def cached_mandelbulb_points(frame, sample_count=2000, seed=0, resolution=60, count=25):
+    """Approximation of fractals.generate_mandelbulb_points, served from the slice cache.
+
+    Same samples, but each is snapped to its nearest grid cell (rint) and its
+    iteration count blended linearly between the two nearest power slices,
+    so points near the surface can differ from the exact cloud (at 60^3 a few
+    percent of them, e.g. 15204 vs 14657 survivors of 20000 at frame 90).
+    """
+    powers, slices = power_slices(resolution, count)
+    p = mandelbulb_power(frame)
+
+    sx, sy, sz = sample_ball(frame, sample_count, seed)
+    iterations = lookup_iterations(powers, slices, p, sx, sy, sz)
+    survivors = iterations > 3
+    return sx[survivors], sy[survivors], sz[survivors], iterations[survivors]
@@ -0,0 +1,137 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from fractals import sample_ball
+from kernels import escape_time
+from palette import history_colors
+
+# --- PROGRESSIVE REFINEMENT ---
+# Interactive preview of the Mandelbulb: a coarse cloud appears at once,
+# then background workers keep adding refinement passes to the same
+# scatter artist while the view is still.
+#
+#   - Power change  -> the queued work is stale: cancel it, start coarse again.
+#   - Camera moving -> cancel the queued passes and draw only the coarse pass,
+#                      so the rotation stays smooth; refinement resumes once
+#                      still, after the passes already received.
+#
+# Every pass is tagged with the generation it was queued in, and either event
+# starts a new one: a pass still running then is ignored when it lands.
+#
+# Passes run in worker processes, so the GUI thread never waits on the math.
+# Each pass has its own deterministic sample stream (pass index = "frame").
+
+def refinement_pass(power, pass_index, count, seed=0, max_iter=8):
+    sx, sy, sz = sample_ball(pass_index, count, seed)
+    it = escape_time(sx, sy, sz, power, max_iter)
+    survivors = it > 3
+    return sx[survivors], sy[survivors], sz[survivors], it[survivors]
+
+def cloud_colors(it, max_iter=8):
+    return history_colors(it / max_iter)
+
+class ProgressiveCloud:
+    def __init__(self, fig, ax, power, seed=0, coarse=2000, batch=10000, max_samples=400000,
+                 interval=100, still_after=0.3, workers=None):
+        self.fig, self.ax = fig, ax
+        self.power = power
+        self.seed = seed
+        self.coarse, self.batch, self.max_samples = coarse, batch, max_samples
+        self.still_after = still_after
+
+        self.generation = 0
+        self.next_pass = 0
+        self.moving = False
+        self.last_view = (ax.elev, ax.azim)
+        self.last_move = 0.0
+        self.points = []          # Passes received for the current power, in order
+        self.showing_coarse = False
+
+        self.artist = ax.scatter([], [], [], s=6, marker='o', depthshade=False)
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.in_flight = []       # (generation, future)
+
+        self.timer = fig.canvas.new_timer(interval=interval)
+        self.timer.add_callback(self._poll)
+        self.timer.start()
+        fig.canvas.mpl_connect('close_event', lambda event: self.close())
+
+    def set_power(self, power):
+        # Everything queued or received is for the old power
+        self.power = power
+        self.points = []
+        self._new_generation()
+        self._redraw()
+
+    def _new_generation(self):
+        # Passes queued so far are cancelled, the running ones ignored when they land
+        for gen, future in self.in_flight:
+            future.cancel()
+        self.generation += 1
+        self.next_pass = len(self.points) # Received passes are always 0..n-1
+
+    def close(self):
+        self.timer.stop()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def samples(self, passes):
+        """Samples drawn by passes 0..passes-1: the coarse pass, then whole batches."""
+        return 0 if passes == 0 else self.coarse + (passes - 1) * self.batch
+
+    def _submit(self, last_pass=None):
+        # Keep every worker busy with the next passes of the current generation
+        while (len(self.in_flight) < self.workers and self.samples(self.next_pass) < self.max_samples
+               and (last_pass is None or self.next_pass <= last_pass)):
+            count = self.coarse if self.next_pass == 0 else self.batch
+            future = self.pool.submit(refinement_pass, self.power, self.next_pass, count, self.seed)
+            self.in_flight.append((self.generation, future))
+            self.next_pass += 1
+
+    # --- GUI timer ---
+    def _poll(self):
+        now = time.perf_counter()
+        view = (self.ax.elev, self.ax.azim)
+        if view != self.last_view:
+            self.last_view, self.last_move = view, now
+            if not self.moving:
+                self.moving = True
+                self._new_generation()
+        elif self.moving and now - self.last_move > self.still_after:
+            self.moving = False
+
+        # Collect finished passes (in order); stale ones are dropped
+        fresh = False
+        while self.in_flight and self.in_flight[0][1].done():
+            gen, future = self.in_flight.pop(0)
+            if gen == self.generation and not future.cancelled():
+                self.points.append(future.result())
+                fresh = True
+        self.in_flight = [(g, f) for g, f in self.in_flight if not f.cancelled()]
+
+        if not self.moving:
+            self._submit()
+        elif not self.points:
+            self._submit(last_pass=0) # Moving before the coarse pass arrived
+        if fresh or self.moving != self.showing_coarse:
+            self._redraw()
+
+    def _redraw(self):
+        passes = self.points[:1] if self.moving else self.points
+        self.showing_coarse = self.moving
+        if passes:
+            x, y, z, it = (np.concatenate(a) for a in zip(*passes))
+        else:
+            x = y = z = it = np.zeros(0)
+        self._set_cloud(x, y, z, it)
+        self.ax.set_title(f"ENTITY: 'THE UNIVERSE INSIDE'\nComplexity Power: {self.power:.2f} | "
+                          f"Points: {len(x)} | Samples: {self.samples(len(self.points))}", color='white')
+        self.fig.canvas.draw_idle()
+
+    def _set_cloud(self, x, y, z, it):
+        # 3D scatters have no public set_data: set the 2D offsets, then lift them
+        # to 3D at z (what ax.scatter does), instead of writing _offsets3d
+        self.artist.set_offsets(np.column_stack([x, y]))
+        self.artist.set_3d_properties(z, 'z')
+        self.artist.set_facecolors(cloud_colors(it))
@@ -0,0 +1,148 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib.pyplot as plt
+from kernels import distance_estimate
+from palette import history_colors
+
+# --- CONFIGURATION ---
+WIDTH = 1920
+HEIGHT = 1080
+POWER = 8.0           # Power 8 is the classic Mandelbulb
+ELEV, AZIM = 30, 45   # Camera angles (degrees), as in ax.view_init
+CAMERA_DISTANCE = 3.2
+FOV = 45.0            # Vertical field of view (degrees)
+TILE = 96             # Tile edge in pixels (one task per tile)
+MAX_STEPS = 128
+FAR = 6.0
+WORKERS = os.cpu_count()
+OUTPUT = "mandelbulb_render.png"
+
+# Palette of the point cloud (The History): Violet (Axiom) -> Gold (Epoch) -> Cyan (You)
+RADIUS_OUTER = 1.2
+RADIUS_INNER = 0.5
+
+# --- 1. CAMERA ---
+def camera_basis(elev, azim, distance):
+    e, a = np.radians(elev), np.radians(azim)
+    eye = distance * np.array([np.cos(e) * np.cos(a), np.cos(e) * np.sin(a), np.sin(e)])
+    forward = -eye / np.linalg.norm(eye)
+    right = np.cross(forward, [0.0, 0.0, 1.0])
+    right /= np.linalg.norm(right)
+    up = np.cross(right, forward)
+    return eye, forward, right, up
+
+def tile_rays(x0, x1, y0, y1, width, height, elev, azim, distance, fov):
+    eye, forward, right, up = camera_basis(elev, azim, distance)
+    half = np.tan(np.radians(fov) / 2.0)
+    px, py = np.meshgrid(np.arange(x0, x1) + 0.5, np.arange(y0, y1) + 0.5)
+    u = (2.0 * px / width - 1.0) * half * width / height
+    v = (1.0 - 2.0 * py / height) * half
+    dirs = forward + u.reshape(-1, 1) * right + v.reshape(-1, 1) * up
+    dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+    pixel_angle = 2.0 * half / height
+    return eye, dirs, pixel_angle
+
+# --- 2. SPHERE TRACING ---
+def trace(eye, dirs, power, pixel_angle):
+    # March every ray of the batch at once; rays leave the batch as they
+    # touch the surface (d < one pixel's footprint) or fly past FAR.
+    n = len(dirs)
+    t = np.zeros(n)
+    steps = np.zeros(n)
+    hit = np.zeros(n, dtype=bool)
+
+    # Skip the empty space outside the bounding sphere (radius 1.25)
+    b = dirs @ eye
+    c = eye @ eye - 1.25**2
+    disc = b*b - c
+    inside = disc > 0
+    t[inside] = np.maximum(-b[inside] - np.sqrt(disc[inside]), 0.0)
+
+    idx = np.flatnonzero(inside)
+    for step in range(MAX_STEPS):
+        if len(idx) == 0: break
+        p = eye + dirs[idx] * t[idx, None]
+        d = distance_estimate(p[:, 0], p[:, 1], p[:, 2], power)
+        steps[idx] += 1
+
+        done = d < t[idx] * pixel_angle * 0.5
+        hit[idx[done]] = True
+        t[idx] += np.where(done, 0.0, d)
+        idx = idx[~done & (t[idx] < FAR)]
+
+    return t, hit, steps
+
+def surface_normals(p, power, h):
+    # Gradient of the distance estimator (central differences, one batch);
+    # h is the step per point (or one step for all)
+    offsets = np.array([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]], dtype=np.float64)
+    q = (p[None, :, :] + offsets[:, None, :] * np.reshape(h, (1, -1, 1))).reshape(-1, 3)
+    d = distance_estimate(q[:, 0], q[:, 1], q[:, 2], power).reshape(6, -1)
+    n = np.stack([d[0] - d[1], d[2] - d[3], d[4] - d[5]], axis=1)
+    n /= np.maximum(np.linalg.norm(n, axis=1, keepdims=True), 1e-12)
+    return n
+
+# --- 3. SHADING ---
+def palette(n):
+    # Same gradient as the point cloud: Violet -> Gold (n < 0.5), Gold -> Cyan
+    return history_colors(n)[:, :3]
+
+def shade(eye, dirs, t, hit, steps, power, pixel_angle):
+    rgb = np.zeros((len(dirs), 3))
+
+    # Misses: a faint violet glow where rays grazed the fractal
+    glow = (steps / MAX_STEPS)[~hit] ** 2
+    rgb[~hit] = glow[:, None] * np.array([0.5, 0.0, 1.0])
+
+    if hit.any():
+        p = eye + dirs[hit] * t[hit, None]
+        # Step of one pixel's footprint at each hit (a per-tile step would seam the tiles)
+        normal = surface_normals(p, power, h=np.maximum(1e-5, t[hit] * pixel_angle))
+        light = np.array([0.6, 0.3, 0.75])
+        light /= np.linalg.norm(light)
+
+        depth = (RADIUS_OUTER - np.linalg.norm(p, axis=1)) / (RADIUS_OUTER - RADIUS_INNER)
+        base = palette(depth)
+        diffuse = np.clip(normal @ light, 0.0, 1.0)
+        occlusion = 1.0 - steps[hit] / MAX_STEPS
+        half_vec = light - dirs[hit]
+        half_vec /= np.linalg.norm(half_vec, axis=1, keepdims=True)
+        specular = np.clip(np.sum(normal * half_vec, axis=1), 0.0, 1.0) ** 32
+
+        rgb[hit] = base * (0.15 + 0.85 * diffuse)[:, None] * occlusion[:, None] + 0.4 * specular[:, None]
+
+    return np.clip(rgb, 0.0, 1.0)
+
+# --- 4. TILES ---
+def render_tile(task):
+    x0, x1, y0, y1, width, height, power, elev, azim = task
+    eye, dirs, pixel_angle = tile_rays(x0, x1, y0, y1, width, height, elev, azim, CAMERA_DISTANCE, FOV)
+    t, hit, steps = trace(eye, dirs, power, pixel_angle)
+    rgb = shade(eye, dirs, t, hit, steps, power, pixel_angle)
+    return x0, y0, rgb.reshape(y1 - y0, x1 - x0, 3).astype(np.float32)
+
+def render_mandelbulb(width=WIDTH, height=HEIGHT, power=POWER, elev=ELEV, azim=AZIM,
+                      tile=TILE, workers=WORKERS):
+    tasks = [(x0, min(x0 + tile, width), y0, min(y0 + tile, height), width, height, power, elev, azim)
+             for y0 in range(0, height, tile) for x0 in range(0, width, tile)]
+    image = np.zeros((height, width, 3), dtype=np.float32)
+
+    if workers is None or workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(render_tile, tasks, chunksize=1)
+            for x0, y0, rgb in results:
+                image[y0:y0 + rgb.shape[0], x0:x0 + rgb.shape[1]] = rgb
+    else:
+        for task in tasks:
+            x0, y0, rgb = render_tile(task)
+            image[y0:y0 + rgb.shape[0], x0:x0 + rgb.shape[1]] = rgb
+    return image
+
+if __name__ == "__main__":
+    print(f"Tracing the Infinite at {WIDTH}x{HEIGHT} (power {POWER})...")
+    start = time.perf_counter()
+    image = render_mandelbulb()
+    plt.imsave(OUTPUT, image)
+    print(f"Rendered {OUTPUT} in {time.perf_counter() - start:.1f}s")
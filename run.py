@@ -2,6 +2,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from frame_rng import frame_rng
 
 # --- 1. CONFIGURATION: MAX EFFORT ---
 FRAME_COUNT = 80
@@ -10,6 +11,7 @@ SPRINT_SPEED = 0.8  # Very fast cycle
 STRIDE_LENGTH = 1.2 # Massive steps
 LEAN_ANGLE = 0.6    # ~35-40 degrees forward pitch
 FLIGHT_AMPLITUDE = 0.15
+SEED = 0            # Same seed -> same sprint, frame for frame
 
 # --- 2. SKELETON RIG ---
 def get_base_skeleton():
@@ -109,6 +111,15 @@ def calculate_sprint_pose(frame):
 
     return joints
 
+# The cycle only depends on the constants above, so the whole clip is baked
+# once at launch into (frames, joints, 3) (a few ms: not worth a disk cache)
+JOINT_NAMES = list(get_base_skeleton())
+
+def bake_sprint_clip():
+    return np.array([[calculate_sprint_pose(f)[name] for name in JOINT_NAMES] for f in range(FRAME_COUNT)])
+
+sprint_clip = bake_sprint_clip()
+
 # --- 4. RENDERER ---
 fig = plt.figure(figsize=(12, 8))
 ax = fig.add_subplot(111, projection='3d')
@@ -117,13 +128,14 @@ def update(frame):
     ax.clear()
     ax.set_facecolor('#050505') # Pitch black
     
-    joints = calculate_sprint_pose(frame)
+    joints = dict(zip(JOINT_NAMES, sprint_clip[frame % FRAME_COUNT]))
+    rng = frame_rng("sprint", SEED, frame)
     
     # 1. SPEED LINES (The Tunnel Effect)
     # Streaks passing the Titan
     for i in range(10):
-        y = np.random.uniform(-2, 2)
-        z = np.random.uniform(0, 3)
+        y = rng.uniform(-2, 2)
+        z = rng.uniform(0, 3)
         ax.plot([-3, 3], [y, y], [z, z], c='cyan', alpha=0.05, linewidth=1)
     
     # 2. SKELETON & NERVES
@@ -147,9 +159,9 @@ def update(frame):
     for bone in emitters:
         bx, by, bz = joints[bone]
         # Trail behind the runner
-        trail_x = np.random.uniform(-0.1, 0.1, 5) + bx
+        trail_x = rng.uniform(-0.1, 0.1, 5) + bx
         trail_y = np.linspace(by, by - 1.0, 5) # Trailing back
-        trail_z = np.random.uniform(-0.1, 0.1, 5) + bz
+        trail_z = rng.uniform(-0.1, 0.1, 5) + bz
         
         # Color fades from White (Heat) to Red to Invisible
         ax.scatter(trail_x, trail_y, trail_z, c='orange', s=5, alpha=0.3)
@@ -170,9 +182,9 @@ def update(frame):
     for foot in ['foot_l', 'foot_r']:
         fx, fy, fz = joints[foot]
         if fz < 0.15:
-            sx = np.random.uniform(-0.2, 0.2, 5) + fx
-            sy = np.random.uniform(-0.2, 0.2, 5) + fy
-            sz = np.random.uniform(0, 0.3, 5)
+            sx = rng.uniform(-0.2, 0.2, 5) + fx
+            sy = rng.uniform(-0.2, 0.2, 5) + fy
+            sz = rng.uniform(0, 0.3, 5)
             ax.scatter(sx, sy, sz, c='cyan', s=10, marker='*')
 
     # View Settings
@@ -186,5 +198,5 @@ def update(frame):
     ax.view_init(elev=10, azim=100)
 
 print("Titan Sprinting...")
-ani = FuncAnimation(fig, update, frames=np.arange(0, 80), interval=20)
+ani = FuncAnimation(fig, update, frames=np.arange(0, FRAME_COUNT), interval=20)
 plt.show()
\ No newline at end of file
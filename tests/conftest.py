@@ -0,0 +1,16 @@
+import os
+import sys
+import pytest
+
+# The modules live at the repo root, next to the scenes
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kernels
+
+@pytest.fixture(params=["numpy", "numba"])
+def kernel_path(request, monkeypatch):
+    """Runs a test once per kernel path (numba only where it is installed)."""
+    if request.param == "numba" and not kernels.HAVE_NUMBA:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(kernels, "HAVE_NUMBA", request.param == "numba")
+    return request.param
@@ -0,0 +1,66 @@
+import datetime
+import warnings
+import numpy as np
+import pytest
+import attractors
+from attractors import ATTRACTORS, Attractor, attractor_for_date
+from density import DensityImage, frame_points
+
+def blowup_derivative(x, y, z, params):
+    # x' = x^2 reaches infinity at t = 1/x0; x0 <= 0 stays finite
+    return x*x, -params[0]*y, -params[0]*z
+
+STARTS = np.array([[0.0, 1.0, 1.0], [2.0, 1.0, 1.0], [0.0, -1.0, 0.5], [0.45, 0.0, 0.0]])
+
+@pytest.fixture
+def system():
+    return Attractor("blowup", blowup_derivative, (1.0,), dt=0.01, burn_in=0)
+
+def test_stream_drops_diverging_trails(system, kernel_path):
+    # x0 = 2 blows up at t = 0.5 (second block), x0 = 0.45 at t = 2.2 (sixth)
+    blocks = [block.copy() for block in system.stream(STARTS, 300, chunk=40)]
+    assert [len(b) for b in blocks] == [4, 3, 3, 3, 3, 2, 2, 2]
+    assert sum(b.shape[1] for b in blocks) == 301
+    assert all(np.isfinite(b).all() for b in blocks)
+
+def test_stream_matches_trajectories_after_drops(system, kernel_path):
+    survivors = system.trajectories(STARTS, 300)
+    blocks = [block.copy() for block in system.stream(STARTS, 300, chunk=40)]
+    assert len(survivors) == 2
+    assert np.array_equal(blocks[-1], survivors[:, -blocks[-1].shape[1]:])
+
+def test_survey_samples_the_whole_run():
+    lorenz = ATTRACTORS["lorenz"]
+    starts = lorenz.sample_starts(np.random.default_rng(0), 64)
+    trails = lorenz.trajectories(starts[::4], 1000)
+    sample = lorenz.survey(starts, 1000, trails=16, points=1600, chunk=250)
+    # Every 10th point of each block of every 4th trail, start point to the last block
+    assert len(sample) == 16 * (26 + 3 * 25)
+    assert np.array_equal(sample[:16 * 26].reshape(16, 26, 3), trails[:, 0:251:10])
+    assert np.array_equal(sample[-16 * 25:].reshape(16, 25, 3), trails[:, 751::10])
+
+def test_dream_cycle_is_frozen(monkeypatch):
+    days = [datetime.date(2026, 1, 1) + datetime.timedelta(days=i) for i in range(30)]
+    before = [attractor_for_date(day).name for day in days]
+    # The original cycle: the registry's names in sorted order at the time
+    assert before == [sorted(ATTRACTORS)[day.toordinal() % 6] for day in days]
+
+    # A newly registered system changes nothing until an era brings it in
+    monkeypatch.setitem(ATTRACTORS, "blowup", Attractor("blowup", blowup_derivative, (1.0,), dt=0.01))
+    assert [attractor_for_date(day).name for day in days] == before
+
+    later = datetime.date(2026, 1, 20)
+    cycle = attractors.DREAM_ERAS[-1][1] + ("blowup",)
+    monkeypatch.setattr(attractors, "DREAM_ERAS", attractors.DREAM_ERAS + ((later, cycle),))
+    assert [attractor_for_date(day).name for day in days if day < later] == before[:19]
+    assert "blowup" in [attractor_for_date(later + datetime.timedelta(days=i)).name for i in range(7)]
+
+def test_diverging_trails_are_silent(system, kernel_path, tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        assert len(system.trajectories(STARTS, 300)) == 2
+        frames = system.record(str(tmp_path / "run"), STARTS, 300, chunk=40).read()
+        image = DensityImage(16, 16, frame_points(frames.reshape(-1, 3), 16, 16))
+        image.add(frames)
+    assert np.isnan(frames[-1, [1, 3]]).all()
+    assert image.total == np.isfinite(frames).all(axis=2).sum()
@@ -0,0 +1,50 @@
+import numpy as np
+import density
+from density import DensityImage, camera_matrix, frame_points
+from raymarch import tile_rays
+
+W, H = 40, 30
+
+def project(camera, points):
+    h = points @ camera[:, :3].T + camera[:, 3]
+    return h[:, :2] / h[:, 2:]
+
+def test_camera_matches_the_ray_marcher():
+    # A point along the ray through a pixel centre lands on that pixel centre
+    eye, dirs, _ = tile_rays(0, W, 0, H, W, H, 30, 45, 3.2, 45.0)
+    uv = project(camera_matrix(W, H, 30, 45, 3.2), eye + 2.0 * dirs)
+    px, py = np.meshgrid(np.arange(W) + 0.5, np.arange(H) + 0.5)
+    np.testing.assert_allclose(uv, np.column_stack([px.ravel(), py.ravel()]), atol=1e-9)
+
+def test_framed_cloud_is_in_view():
+    points = np.random.default_rng(0).normal([5.0, -3.0, 2.0], [2.0, 1.0, 0.5], (5000, 3))
+    image = DensityImage(W, H, frame_points(points, W, H))
+    image.add(points)
+    assert image.counts.sum() / image.total > 0.99
+
+def test_chunked_accumulation(monkeypatch):
+    points = np.random.default_rng(1).uniform(-1, 1, (1000, 3))
+    values = np.linspace(0.0, 1.0, 1000)
+    camera = frame_points(points, W, H)
+    whole = DensityImage(W, H, camera)
+    whole.add(points, values)
+    monkeypatch.setattr(density, "CHUNK", 97)
+    chunked = DensityImage(W, H, camera)
+    chunked.add(points[:500], values[:500])
+    chunked.add(points[500:], values[500:])
+    np.testing.assert_array_equal(chunked.counts, whole.counts)
+    np.testing.assert_allclose(chunked.values, whole.values)
+
+def test_points_behind_the_camera_are_not_drawn():
+    camera = camera_matrix(W, H, 0, 0, 3.0)
+    image = DensityImage(W, H, camera)
+    image.add(np.array([[0.0, 0.0, 0.0], [6.0, 0.0, 0.0]])) # In front of the eye at (3, 0, 0), and behind it
+    assert image.counts.sum() == 1 and image.total == 2
+
+def test_tone_map_colours_by_mean_value():
+    image = DensityImage(W, H, camera_matrix(W, H, 0, 0, 3.0))
+    image.add(np.zeros((4, 3)), 1.0)
+    rgb = image.tone_map(cmap='gray', background=(0.0, 0.0, 1.0))
+    assert rgb.shape == (H, W, 3)
+    np.testing.assert_allclose(rgb[H // 2, W // 2], [1.0, 1.0, 1.0]) # Peak pixel: full brightness, white
+    np.testing.assert_allclose(rgb[0, 0], [0.0, 0.0, 1.0])           # Empty pixel: background
@@ -0,0 +1,30 @@
+from datetime import date
+import numpy as np
+import pytest
+import dream_analysis
+import lucid_dream
+
+DAY = date(2026, 2, 18) # Lorenz: the first block sits on one lobe
+
+def test_occupancy_needs_a_generator():
+    system, params, starts = lucid_dream.dream_setup(DAY)
+    with pytest.raises(TypeError):
+        dream_analysis.occupancy(system, starts[:10], params)
+
+def test_grid_covers_the_whole_run():
+    system, params, starts = lucid_dream.dream_setup(DAY)
+    starts = starts[:200]
+    lo, scale = dream_analysis.fit_grid(system.survey(starts, 2000, params, chunk=500))
+    cells = np.concatenate([((block.reshape(-1, 3) - lo) * scale) for block in system.stream(starts, 2000, params, 500)])
+    inside = ((cells >= 0) & (cells < dream_analysis.GRID)).all(axis=1)
+    assert inside.mean() > 0.99
+
+def test_mood_is_rewritten_byte_for_byte(tmp_path, monkeypatch):
+    monkeypatch.setattr(lucid_dream, "JOURNAL", str(tmp_path))
+    path = dream_analysis.write_mood(DAY)
+    with open(path, 'rb') as f:
+        first = f.read()
+    assert dream_analysis.write_mood(DAY) == path
+    with open(path, 'rb') as f:
+        assert f.read() == first
+    assert b"seconds" not in first
@@ -0,0 +1,50 @@
+import os
+from datetime import date
+from functools import partial
+import numpy as np
+import pytest
+import dream_video
+import lucid_dream
+from density import DensityImage
+from frame_pipeline import FramePipeline
+
+DAY = date(2026, 2, 18) # Lorenz: the first block sits on one lobe
+
+@pytest.fixture
+def short_video(monkeypatch):
+    monkeypatch.setattr(lucid_dream, "TRAJECTORIES", 200)
+    monkeypatch.setattr(dream_video, "SECONDS", 10)
+    monkeypatch.setattr(dream_video, "FPS", 10)
+    monkeypatch.setattr(dream_video, "_dream", {})
+    return dream_video.SECONDS * dream_video.FPS
+
+def test_chunks_are_the_stream_in_order(short_video):
+    system, params, starts = lucid_dream.dream_setup(DAY)
+    trails = system.trajectories(starts, short_video * dream_video.STEPS_PER_FRAME, params)
+    chunks = [dream_video.dream_chunk(DAY.toordinal(), frame)["points"] for frame in range(short_video)]
+    steps = np.concatenate([c.reshape(len(trails), -1, 3) for c in chunks], axis=1)
+    assert np.array_equal(steps, trails[:, 1:])
+
+def test_video_is_framed_on_the_whole_run(short_video):
+    system, params, starts = lucid_dream.dream_setup(DAY)
+    w, h = dream_video.WIDTH, dream_video.HEIGHT
+    camera = lucid_dream.dream_camera(system, params, starts, short_video * dream_video.STEPS_PER_FRAME, w, h)
+    image = DensityImage(w, h, camera)
+    for frame in range(short_video):
+        image.add(dream_video.dream_chunk(DAY.toordinal(), frame)["points"])
+    assert image.counts.sum() / image.total > 0.99
+
+def test_without_ffmpeg_returns_the_frame_folder(tmp_path, monkeypatch):
+    # Spawned, not forked (this process has run numba kernels): the integrator
+    # re-imports the modules, so only renderer-side settings are shrunk here
+    monkeypatch.setattr(lucid_dream, "JOURNAL", str(tmp_path))
+    monkeypatch.setattr(dream_video, "SECONDS", 1)
+    monkeypatch.setattr(dream_video, "FPS", 4)
+    monkeypatch.setattr(dream_video, "WIDTH", 64)
+    monkeypatch.setattr(dream_video, "HEIGHT", 64)
+    monkeypatch.setattr(dream_video, "FramePipeline", partial(FramePipeline, start_method="spawn"))
+    monkeypatch.setattr(dream_video, "video_writer", dream_video.FrameSequenceWriter)
+
+    written = dream_video.animate_dream(DAY)
+    assert os.path.isdir(written)
+    assert sorted(os.listdir(written)) == [f"frame_{i:05d}.png" for i in range(4)]
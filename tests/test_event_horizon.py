@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import event_horizon
+from event_horizon import DISK_INNER, disk_flux, render_black_hole, starfield
+from kernels import null_geodesics
+
+R0 = 1000.0 # Start far out, in Schwarzschild radii
+
+def shoot(b):
+    """Photons aimed past the hole with impact parameter b."""
+    b = np.atleast_1d(np.asarray(b, dtype=np.float64))
+    u0 = np.full(len(b), 1.0 / R0)
+    v0 = np.sqrt(1.0 / b**2 - u0**2 * (1.0 - u0)) # Inbound: u grows
+    return null_geodesics(u0, v0, np.full(len(b), 0.3))
+
+def test_photon_sphere_splits_capture_from_escape(kernel_path):
+    # Critical impact parameter 3 sqrt(3) / 2 = 2.598 r_s
+    _, _, escaped = shoot([2.55, 2.59, 2.61, 2.65])
+    assert escaped.tolist() == [False, False, True, True]
+
+def test_weak_field_deflection(kernel_path):
+    b = 50.0
+    _, phi_end, escaped = shoot(b)
+    m = 0.5 # Mass in units of r_s
+    deflection = phi_end[0] - (np.pi - np.arcsin(b / R0))
+    assert escaped[0]
+    assert deflection == pytest.approx(4 * m / b + 15 * np.pi / 4 * (m / b)**2, abs=2e-3)
+
+def test_disk_profile():
+    flux = disk_flux(np.array([1.0, DISK_INNER, DISK_INNER * 49 / 36, 12.0]))
+    assert flux[0] == flux[1] == 0.0 # Nothing inside the innermost stable orbit
+    assert flux[2] == pytest.approx(1.0)
+    assert 0.0 < flux[3] < 1.0
+
+def test_starfield_is_fixed_to_the_sky():
+    dirs = np.random.default_rng(0).normal(size=(500, 3))
+    dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+    # A direction's colour depends on nothing else in the batch
+    np.testing.assert_allclose(starfield(dirs), starfield(dirs[::-1])[::-1], rtol=1e-12)
+
+def test_render_shows_the_shadow_and_the_disk():
+    whole = render_black_hole(48, 32, tile=48, workers=1)
+    np.testing.assert_array_equal(render_black_hole(48, 32, tile=10, workers=1), whole)
+    assert whole[14:17, 22:27].max() == 0.0            # The shadow
+    assert whole[17:19, 20:29].max(axis=2).min() > 0.2 # The near side of the disk, in front of it
@@ -0,0 +1,41 @@
+import os
+import numpy as np
+import pytest
+from frame_pipeline import FramePipeline
+
+FIELDS = {"x": ((8,), np.float64)}
+START = "spawn" # Other tests have run numba kernels in this process already
+
+def simulate(frame):
+    return {"x": np.full(frame + 1, float(frame))}
+
+def simulate_then_die(frame):
+    if frame == 3:
+        os._exit(7)
+    return simulate(frame)
+
+def simulate_then_raise(frame):
+    if frame == 3:
+        raise ValueError("bad frame")
+    return simulate(frame)
+
+def test_frames_arrive_in_order_then_end():
+    with FramePipeline(simulate, FIELDS, range(6), slots=2, start_method=START) as pipeline:
+        seen = [(frame, state["x"].copy()) for frame, state in pipeline]
+        with pipeline.frame() as (frame, state):
+            assert frame is None and state is None
+    assert [frame for frame, _ in seen] == list(range(6))
+    for frame, x in seen:
+        np.testing.assert_array_equal(x, np.full(frame + 1, float(frame)))
+
+@pytest.mark.parametrize("stage", [simulate_then_die, simulate_then_raise])
+def test_dead_simulator_raises_instead_of_hanging(stage):
+    with FramePipeline(stage, FIELDS, range(6), slots=2, start_method=START) as pipeline:
+        frames = []
+        with pytest.raises(RuntimeError, match="exited with code"):
+            for frame, _ in pipeline:
+                frames.append(frame)
+        assert frames == [0, 1, 2]
+        # The stream has ended: no second wait on the dead process
+        with pipeline.frame() as (frame, state):
+            assert frame is None
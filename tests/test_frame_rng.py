@@ -0,0 +1,22 @@
+import numpy as np
+from frame_rng import frame_key, frame_rng, frame_sequence, scene_sequence
+
+def draws(scene, seed, frame):
+    return frame_rng(scene, seed, frame).random(8)
+
+def test_frame_ignores_call_order():
+    forward = [draws("sprint", 0, frame) for frame in range(5)]
+    backward = [draws("sprint", 0, frame) for frame in reversed(range(5))][::-1]
+    np.testing.assert_array_equal(forward, backward)
+
+def test_frame_is_the_spawned_child():
+    spawned = scene_sequence("sprint", 3).spawn(10)[7]
+    assert frame_sequence("sprint", 3, 7).generate_state(4).tolist() == spawned.generate_state(4).tolist()
+
+def test_scenes_seeds_and_frames_are_independent():
+    base = draws("sprint", 0, 1)
+    for other in (draws("epoch", 0, 1), draws("sprint", 1, 1), draws("sprint", 0, 2)):
+        assert not np.array_equal(base, other)
+
+def test_frame_key_is_stable():
+    assert frame_key("sprint", 0, 42) == "sprint-0-000042"
@@ -0,0 +1,55 @@
+import json
+import os
+import numpy as np
+import matplotlib.image as mpimg
+import pytest
+from gallery import THUMB_SIZE, build_gallery
+
+def dream(journal, day, shade):
+    path = journal / f"dream_{day}.png"
+    mpimg.imsave(path, np.full((400, 300, 3), shade))
+    return path
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = tmp_path / "dreams"
+    journal.mkdir()
+    for i, day in enumerate(["2026-02-17", "2026-02-19", "2026-02-18"]):
+        dream(journal, day, 0.2 * (i + 1))
+    return journal
+
+def index(journal):
+    return json.loads((journal / "index.json").read_text())
+
+def test_first_build_makes_every_thumbnail(journal):
+    assert build_gallery(str(journal), workers=1) == 3
+    catalogue = index(journal)
+    assert [c["date"] for c in catalogue] == ["2026-02-19", "2026-02-18", "2026-02-17"]
+    thumb = mpimg.imread(journal / catalogue[0]["thumb"])
+    assert max(thumb.shape[:2]) <= THUMB_SIZE
+    assert 'href="dream_2026-02-19.png"' in (journal / "index.html").read_text()
+
+def test_unchanged_journal_writes_nothing(journal):
+    build_gallery(str(journal), workers=1)
+    written = {name: os.stat(journal / name).st_mtime_ns for name in ("manifest.json", "index.json", "index.html")}
+    assert build_gallery(str(journal), workers=1) == 0
+    assert {name: os.stat(journal / name).st_mtime_ns for name in written} == written
+
+def test_touched_file_is_rehashed_not_rethumbed(journal):
+    build_gallery(str(journal), workers=1)
+    path = journal / "dream_2026-02-18.png"
+    os.utime(path, ns=(1, 1))
+    assert build_gallery(str(journal), workers=1) == 0
+    manifest = json.loads((journal / "manifest.json").read_text())
+    assert manifest[path.name]["mtime_ns"] == 1
+
+def test_changed_and_deleted_dreams_drop_their_thumbnails(journal):
+    build_gallery(str(journal), workers=1)
+    before = {c["image"]: c["thumb"] for c in index(journal)}
+    dream(journal, "2026-02-18", 0.9)
+    os.remove(journal / "dream_2026-02-17.png")
+    assert build_gallery(str(journal), workers=1) == 1
+    after = {c["image"]: c["thumb"] for c in index(journal)}
+    assert sorted(after) == ["dream_2026-02-18.png", "dream_2026-02-19.png"]
+    assert after["dream_2026-02-18.png"] != before["dream_2026-02-18.png"]
+    assert sorted(os.listdir(journal / "thumbs")) == sorted(os.path.basename(t) for t in after.values())
@@ -0,0 +1,55 @@
+import importlib
+import numpy as np
+import pytest
+import geometry_cache
+from geometry_cache import cached_array, cache_path
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometry_cache, "CACHE_DIR", str(tmp_path))
+
+def ones():
+    return np.ones(4)
+
+def zeros():
+    return np.zeros(4)
+
+def test_generator_is_part_of_the_key():
+    params = {"n": 4}
+    assert cache_path("blob", params, ones) != cache_path("blob", params, zeros)
+    np.testing.assert_array_equal(cached_array("blob", params, ones), np.ones(4))
+    np.testing.assert_array_equal(cached_array("blob", params, zeros), np.zeros(4))
+
+def test_edited_generator_misses_the_cache(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = tmp_path / "scene_under_edit.py"
+    module.write_text("import numpy as np\ndef build():\n    return np.ones(4)\n")
+    import scene_under_edit
+    before = cache_path("blob", {}, scene_under_edit.build)
+
+    module.write_text("import numpy as np\ndef build():\n    return np.ones(4) * 2\n")
+    importlib.reload(scene_under_edit)
+    assert cache_path("blob", {}, scene_under_edit.build) != before
+    np.testing.assert_array_equal(cached_array("blob", {}, scene_under_edit.build), np.full(4, 2.0))
+
+def test_wrapper_uses_the_named_generator():
+    params = {"n": 4}
+    path = cache_path("blob", params, ones)
+    cached_array("blob", params, lambda: ones(), ones)
+    assert np.load(path).sum() == 4
+
+def test_edited_callee_misses_the_cache(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = tmp_path / "scene_with_helper.py"
+    module.write_text("import numpy as np\ndef helper():\n    return 1.0\n"
+                      "def build():\n    return np.full(4, helper())\n")
+    import scene_with_helper as scene
+    before = cache_path("blob", {}, (scene.build, scene.helper))
+
+    module.write_text("import numpy as np\ndef helper():\n    return 3.0\n"
+                      "def build():\n    return np.full(4, helper())\n")
+    importlib.reload(scene)
+    assert cache_path("blob", {}, scene.build) == cache_path("blob", {}, (scene.build,))
+    assert cache_path("blob", {}, (scene.build, scene.helper)) != before
+    np.testing.assert_array_equal(cached_array("blob", {}, scene.build, (scene.build, scene.helper)),
+                                  np.full(4, 3.0))
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+import kernels
+from fractals import FRACTALS
+
+def numpy_and_compiled(monkeypatch, run):
+    if not kernels.HAVE_NUMBA:
+        pytest.skip("numba not installed")
+    compiled = run()
+    monkeypatch.setattr(kernels, "HAVE_NUMBA", False)
+    return run(), compiled
+
+@pytest.mark.parametrize("name", sorted(FRACTALS))
+def test_builtin_steps_match_numpy(name, monkeypatch):
+    fractal = FRACTALS[name]
+    x = np.linspace(-1.0, 1.0, 4000) * fractal.extent
+    numpy_it, compiled_it = numpy_and_compiled(monkeypatch, lambda: fractal.escape_time(x, 0.6 * x, -0.3 * x, 7))
+    assert np.array_equal(numpy_it, compiled_it)
+
+@pytest.mark.parametrize("derivative", kernels.BUILTIN_DERIVATIVES, ids=lambda d: d.__name__)
+def test_builtin_derivatives_match_numpy(derivative, monkeypatch):
+    from attractors import ATTRACTORS
+    system = next(a for a in ATTRACTORS.values() if a.derivative is derivative)
+    starts = system.sample_starts(np.random.default_rng(0), 8)
+    run = lambda: kernels.integrate(derivative, starts, system.dt, 200, system.params)
+    numpy_trails, compiled_trails = numpy_and_compiled(monkeypatch, run)
+    assert np.allclose(numpy_trails, compiled_trails, rtol=1e-9, atol=1e-9, equal_nan=True)
@@ -0,0 +1,37 @@
+from datetime import date
+import numpy as np
+import matplotlib.image as mpimg
+import pytest
+import lucid_dream
+
+DROPPING_DAY = date(2026, 2, 19) # Rossler: some trails of the ensemble blow up
+
+@pytest.fixture
+def small_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(lucid_dream, "JOURNAL", str(tmp_path / "dreams"))
+    monkeypatch.setattr(lucid_dream, "TRAJECTORIES", 300)
+    monkeypatch.setattr(lucid_dream, "WIDTH", 64)
+    monkeypatch.setattr(lucid_dream, "HEIGHT", 64)
+    return tmp_path
+
+def test_record_redraw_round_trip_on_a_dropping_day(small_journal, monkeypatch):
+    # Stopped after 400 steps, then resumed to 1000 ...
+    lucid_dream.record_dream(DROPPING_DAY, 400)
+    frames = lucid_dream.record_dream(DROPPING_DAY, 1000).read()
+    assert len(frames) == 1001
+    assert not np.isfinite(frames).all() # The day really does lose trails
+
+    # ... stores the same frames as one uninterrupted run
+    monkeypatch.setattr(lucid_dream, "JOURNAL", str(small_journal / "again"))
+    assert np.array_equal(lucid_dream.record_dream(DROPPING_DAY, 1000).read(), frames, equal_nan=True)
+
+    image = mpimg.imread(lucid_dream.redraw_dream(DROPPING_DAY))
+    assert image[..., :3].max() > 0.5 # Not the all-black frame of a NaN camera
+
+@pytest.mark.parametrize("day", [date(2026, 2, 18), DROPPING_DAY])
+def test_dream_is_framed_on_the_whole_run(small_journal, day):
+    # The first block of 2026-02-18 sits on one lobe of the Lorenz attractor
+    system, params, starts = lucid_dream.dream_setup(day)
+    camera = lucid_dream.dream_camera(system, params, starts, lucid_dream.STEPS)
+    image = lucid_dream.draw_dream(system.stream(starts, lucid_dream.STEPS, params, lucid_dream.CHUNK_STEPS), camera)
+    assert image.counts.sum() / image.total > 0.99
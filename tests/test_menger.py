@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+import geometry_cache
+from menger import menger_occupancy, menger_points, menger_voxels, surface_level, surface_voxels
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometry_cache, "CACHE_DIR", str(tmp_path))
+
+@pytest.mark.parametrize("level", [0, 1, 2, 3])
+def test_voxels_match_the_occupancy_grid(level):
+    voxels = menger_voxels(level)
+    assert len(voxels) == 20**level
+    grid = np.zeros((3**level,) * 3, dtype=bool)
+    grid[tuple(voxels.T)] = True
+    assert np.array_equal(grid, menger_occupancy(level))
+
+def test_surface_counts():
+    assert [len(surface_voxels(level)) for level in range(4)] == [1, 20, 392, 7544]
+
+def test_budget_picks_the_deepest_whole_surface():
+    assert surface_level(7543) == 2
+    assert surface_level(7544) == 3
+    assert surface_level(8000, max_level=3) == 3
+
+def test_points_keep_every_hole():
+    # No cube centre of a level-2 surface sits in a hole of either level
+    u = menger_points(2)
+    assert len(u) == 392
+    for scale in (3, 9):
+        middle = (np.floor(u * scale) % 3 == 1).sum(axis=1)
+        assert (middle < 2).all()
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+import mesh_export
+from menger import menger_occupancy
+from mesh_export import chunk_tasks, mesh_chunk, write_binary_stl, STL_RECORD
+
+@pytest.fixture(params=["skimage", "tetrahedra"])
+def mesher(request, monkeypatch):
+    if request.param == "skimage" and not mesh_export.HAVE_SKIMAGE:
+        pytest.skip("scikit-image not installed")
+    monkeypatch.setattr(mesh_export, "HAVE_SKIMAGE", request.param == "skimage")
+    return request.param
+
+def mesh(field, resolution, chunk):
+    return np.concatenate([tri for tri in map(mesh_chunk, chunk_tasks(field, resolution, chunk)) if len(tri)])
+
+def edge_uses(tri):
+    # Corners welded by their exact float32 coordinates, as an STL reader does
+    _, ids = np.unique(tri.reshape(-1, 3), axis=0, return_inverse=True)
+    ids = ids.reshape(-1, 3)
+    edges = np.concatenate([ids[:, [0, 1]], ids[:, [1, 2]], ids[:, [2, 0]]])
+    _, undirected = np.unique(np.sort(edges, axis=1), axis=0, return_counts=True)
+    _, directed = np.unique(edges, axis=0, return_counts=True)
+    return ids, undirected, directed
+
+@pytest.mark.parametrize("resolution", [33, 65])
+def test_titan_mesh_is_closed_and_manifold(mesher, resolution):
+    # Odd resolutions put samples exactly on the sponge's faces
+    tri = mesh("titan", resolution, chunk=16)
+    ids, undirected, directed = edge_uses(tri)
+    assert len(tri) > 0
+    assert (ids[:, 0] != ids[:, 1]).all() and (ids[:, 1] != ids[:, 2]).all() and (ids[:, 2] != ids[:, 0]).all()
+    assert (undirected == 2).all() # Every edge between exactly two faces
+    assert (directed == 1).all()   # ... which run it in opposite directions (consistent winding)
+
+def test_titan_field_is_axioms_sponge():
+    # Sampled at the cube centres Axiom draws, mapped onto the torso the same way
+    level = mesh_export.TITAN_LEVEL
+    u = (np.indices((3**level,) * 3).reshape(3, -1).T + 0.5) / 3**level
+    z = u[:, 2] * mesh_export.TITAN_HEIGHT
+    radius = 0.5 + z * 0.2
+    inside = mesh_export.titan_field((u[:, 0] * 2 - 1) * radius, (u[:, 1] * 2 - 1) * radius, z) > 0
+    assert np.array_equal(inside, menger_occupancy(level).ravel())
+
+def test_binary_stl_round_trip(tmp_path):
+    tri = mesh("titan", 17, chunk=8)
+    path = tmp_path / "titan.stl"
+    count = write_binary_stl(path, [tri[:10], np.zeros((0, 3, 3)), tri[10:]], b"TITAN")
+    data = path.read_bytes()
+    assert count == len(tri)
+    assert data[:5] == b"TITAN" and np.frombuffer(data[80:84], np.uint32)[0] == count
+    records = np.frombuffer(data[84:], STL_RECORD)
+    assert np.array_equal(records['v'], tri)
+    assert np.allclose(np.linalg.norm(records['normal'], axis=1), 1.0, atol=1e-5)
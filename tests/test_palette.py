@@ -0,0 +1,21 @@
+import numpy as np
+from palette import HISTORY, LUT_SIZE, bake_lut, history_colors, history_gradient, lut_colors, lut_indices
+
+def test_lut_matches_the_gradient_at_its_samples():
+    n = np.linspace(0.0, 1.0, LUT_SIZE)
+    np.testing.assert_allclose(history_colors(n), history_gradient(n))
+
+def test_values_take_the_nearest_entry():
+    n = np.random.default_rng(0).random(1000)
+    nearest = np.rint(n * (LUT_SIZE - 1)) / (LUT_SIZE - 1)
+    np.testing.assert_allclose(history_colors(n), history_gradient(nearest), atol=1e-12)
+
+def test_values_outside_the_range_take_the_end_colours():
+    colors = lut_colors([-5.0, -1.0, 1.0, 7.0], HISTORY, lo=-1.0, hi=1.0)
+    np.testing.assert_array_equal(colors, HISTORY[[0, 0, -1, -1]])
+
+def test_index_dtype_follows_the_table_size():
+    assert lut_indices([0.5]).dtype == np.uint8
+    assert lut_indices([0.5], size=1024).tolist() == [512]
+    lut = bake_lut(lambda n: np.column_stack([n, n, n, np.ones_like(n)]), size=1024)
+    assert lut_colors([1.0], lut)[0, 0] == 1.0
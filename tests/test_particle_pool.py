@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from particle_pool import ParticlePool
+
+def pool(capacity=4):
+    return ParticlePool(capacity, lifetime=10.0, bounds_min=(-100, -100, -100), bounds_max=(100, 100, 100))
+
+def test_spawn_past_capacity_keeps_positions_with_their_velocities():
+    p = pool()
+    pos = np.arange(6.0)[:, None] * np.ones(3)
+    p.spawn(pos, pos * 10.0)
+    assert len(p) == 4
+    np.testing.assert_array_equal(np.sort(p.pos[:, 0]), [2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(p.vel, p.pos * 10.0)
+
+def test_spawn_from_one_point():
+    p = pool()
+    p.spawn((1.0, 2.0, 3.0), np.ones((6, 3)))
+    np.testing.assert_array_equal(p.positions(), np.tile([1.0, 2.0, 3.0], (4, 1)))
+
+def test_spawn_rejects_mismatched_rows():
+    with pytest.raises(ValueError):
+        pool().spawn(np.zeros((3, 3)), np.zeros((5, 3)))
+
+def test_full_pool_recycles_the_oldest():
+    p = pool(2)
+    p.spawn(np.zeros((2, 3)), np.zeros((2, 3)))
+    p.age[:] = (5.0, 1.0)
+    p.spawn((7.0, 7.0, 7.0), (0.0, 0.0, 0.0))
+    np.testing.assert_array_equal(p.pos[0], [7.0, 7.0, 7.0])
+    assert p.age[1] == 1.0
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+import geometry_cache
+import power_cache
+from fractals import generate_mandelbulb_points
+from kernels import escape_time
+from power_cache import EXTENT, cached_mandelbulb_points, lookup_iterations, power_slices
+
+RESOLUTION, COUNT = 21, 7 # Slices at powers 2, 3, ..., 8
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometry_cache, "CACHE_DIR", str(tmp_path))
+    power_slices.cache_clear()
+    yield tmp_path
+    power_slices.cache_clear()
+
+def grid_points():
+    axis = np.linspace(-EXTENT, EXTENT, RESOLUTION)
+    return [a.ravel() for a in np.meshgrid(axis, axis, axis, indexing='ij')]
+
+def test_slices_are_built_once_and_memory_mapped(cache_dir):
+    powers, slices = power_slices(RESOLUTION, COUNT)
+    assert isinstance(slices, np.memmap) and slices.shape == (COUNT,) + (RESOLUTION,) * 3
+    np.testing.assert_array_equal(powers, np.arange(2.0, 9.0))
+    assert len(list(cache_dir.glob("mandelbulb_slices*.npy"))) == 1
+
+def test_lookup_is_exact_on_the_grid():
+    powers, slices = power_slices(RESOLUTION, COUNT)
+    x, y, z = grid_points()
+    for power in (2.0, 5.0, 8.0):
+        np.testing.assert_array_equal(lookup_iterations(powers, slices, power, x, y, z),
+                                      escape_time(x, y, z, power))
+
+def test_lookup_blends_between_slices():
+    powers, slices = power_slices(RESOLUTION, COUNT)
+    x, y, z = grid_points()
+    blend = lookup_iterations(powers, slices, 4.25, x, y, z)
+    np.testing.assert_allclose(blend, 0.75 * escape_time(x, y, z, 4.0) + 0.25 * escape_time(x, y, z, 5.0))
+
+def test_cached_cloud_approximates_the_exact_one():
+    # Same samples; only the points near the surface may disagree
+    exact = generate_mandelbulb_points(90, 4000)
+    cached = cached_mandelbulb_points(90, 4000, resolution=RESOLUTION, count=COUNT)
+    assert abs(len(cached[0]) - len(exact[0])) < 0.1 * len(exact[0])
+    assert np.isin(cached[0], exact[0]).mean() > 0.9
@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pytest
+import progressive
+from progressive import ProgressiveCloud
+
+class InlinePool:
+    # Stands in for the process pool: runs each pass when it is submitted
+    def __init__(self, max_workers):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+@pytest.fixture
+def cloud(monkeypatch):
+    monkeypatch.setattr(progressive, "ProcessPoolExecutor", InlinePool)
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    cloud = ProgressiveCloud(fig, ax, 8.0, coarse=200, batch=500, max_samples=2200, workers=2)
+    yield cloud
+    cloud.close()
+    plt.close(fig)
+
+def counts(cloud):
+    return [args[2] for args in cloud.pool.submitted]
+
+def test_samples_per_pass(cloud):
+    assert [cloud.samples(n) for n in range(5)] == [0, 200, 700, 1200, 1700]
+
+def test_refines_up_to_max_samples(cloud):
+    cloud._poll()
+    assert counts(cloud) == [200, 500] # One pass per worker
+    for _ in range(10):
+        cloud._poll()
+    # 200 + 4 * 500 reaches 2200: no fifth batch
+    assert counts(cloud) == [200, 500, 500, 500, 500]
+    assert sum(counts(cloud)) == cloud.samples(len(cloud.points)) == 2200
+    assert "Samples: 2200" in cloud.ax.get_title()
+
+def test_camera_move_keeps_received_passes(cloud):
+    cloud._poll()
+    cloud._poll()
+    received = len(cloud.points)
+    cloud.ax.view_init(elev=10, azim=40)
+    cloud._poll()
+    assert cloud.moving and cloud.generation == 1
+    assert len(cloud.points) == received and cloud.next_pass == received
+    assert len(cloud.artist.get_offsets()) == len(cloud.points[0][0]) # Coarse pass only while moving
@@ -0,0 +1,26 @@
+import numpy as np
+from raymarch import CAMERA_DISTANCE, FOV, render_mandelbulb, tile_rays, trace
+
+W, H = 48, 32
+
+def test_tiles_stitch_into_the_same_image():
+    whole = render_mandelbulb(W, H, tile=max(W, H), workers=1)
+    tiled = render_mandelbulb(W, H, tile=10, workers=1) # Ragged tiles at the right and bottom edges
+    assert whole.shape == (H, W, 3)
+    np.testing.assert_array_equal(tiled, whole)
+
+def test_rays_at_the_centre_hit_and_corners_miss():
+    eye, dirs, pixel_angle = tile_rays(0, W, 0, H, W, H, 30, 45, CAMERA_DISTANCE, FOV)
+    t, hit, _ = trace(eye, dirs, 8.0, pixel_angle)
+    hit = hit.reshape(H, W)
+    assert hit[H // 2 - 1:H // 2 + 1, W // 2 - 1:W // 2 + 1].all()
+    assert not hit[[0, 0, -1, -1], [0, -1, 0, -1]].any()
+    # Hits lie on the bulb, inside its bounding sphere
+    p = eye + dirs[hit.ravel()] * t[hit.ravel(), None]
+    assert (np.linalg.norm(p, axis=1) < 1.25).all()
+
+def test_rays_cover_the_field_of_view():
+    eye, dirs, _ = tile_rays(0, W, 0, H, W, H, 0, 0, CAMERA_DISTANCE, FOV)
+    top, bottom = dirs[W // 2], dirs[(H - 1) * W + W // 2]
+    angle = np.degrees(np.arccos(top @ bottom))
+    assert abs(angle - FOV * (H - 1) / H) < 0.5 # Pixel centres span all but one pixel of the view
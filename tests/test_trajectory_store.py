@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from trajectory_store import TrajectoryStore
+
+def frames(start, stop):
+    return np.arange(start, stop, dtype=np.float64)[:, None, None] + np.zeros((1, 4, 3))
+
+@pytest.fixture
+def store(tmp_path):
+    return TrajectoryStore(str(tmp_path / "run"), (4, 3), dt=0.5, chunk=7)
+
+def test_appends_across_chunks_read_back(store):
+    store.append(frames(0, 5))
+    store.append(frames(5, 23), state=np.full((4, 3), 22.0))
+    assert len(store) == 23
+    np.testing.assert_array_equal(store.read(), frames(0, 23))
+    np.testing.assert_array_equal(store.read(3, 20, 4), frames(3, 20)[::4])
+    np.testing.assert_array_equal(store[-1], frames(22, 23)[0])
+    assert [len(b) for b in store.blocks(4, 23)] == [3, 7, 7, 2]
+
+def test_reopened_store_resumes_from_its_state(store, tmp_path):
+    state = np.full((4, 3), 1 / 3) # Kept in float64, frames are float32
+    store.append(frames(0, 10), state=state)
+    store.append(frames(10, 12), state=state * 2)
+    again = TrajectoryStore(str(tmp_path / "run"))
+    assert len(again) == 12 and again.state.dtype == np.float64
+    np.testing.assert_array_equal(again.state, state * 2)
+    assert len(list((tmp_path / "run").glob("state-*.npy"))) == 1 # The older state is removed
+
+def test_steps_past_the_header_are_ignored(store, tmp_path):
+    store.append(frames(0, 4))
+    # A crash after the data landed but before the header was replaced
+    store._chunk_map(0, writable=True)[4:6] = frames(4, 6)
+    assert len(TrajectoryStore(str(tmp_path / "run"))) == 4
+
+def test_window_selects_by_time(store):
+    store.append(frames(0, 20))
+    assert store.step_range(1.0, 2.5) == (2, 6)
+    np.testing.assert_array_equal(store.window(1.0, 2.5), frames(2, 6))
+
+def test_shape_mismatches_raise(store, tmp_path):
+    with pytest.raises(ValueError):
+        store.append(np.zeros((2, 5, 3)))
+    with pytest.raises(ValueError):
+        TrajectoryStore(str(tmp_path / "run"), (5, 3))
+    with pytest.raises(FileNotFoundError):
+        TrajectoryStore(str(tmp_path / "missing"))
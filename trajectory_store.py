@@ -0,0 +1,159 @@
+import json
+import os
+import numpy as np
+
+# --- TRAJECTORY STORE ---
+# A run too long for RAM (billions of steps of an attractor, a physics scene's
+# state over hours) is written to disk as it is integrated, and read back a
+# time range at a time:
+#
+#   runs/<name>/header.json          frame shape, dtype, dt, steps written, meta
+#   runs/<name>/chunk_00000.npy      frames [0, chunk) as (chunk, *frame_shape)
+#   runs/<name>/chunk_00001.npy      frames [chunk, 2 * chunk) ...
+#   runs/<name>/state-<steps>.npy    full-precision state to resume from
+#
+# Append-only and time-major: a frame is one step of the whole ensemble, so
+# appending and reading a time range both touch contiguous bytes. Chunks are
+# preallocated .npy files opened as memory maps; reads map only the chunks a
+# range falls in. Frames are stored as float32 (half the disk, plenty for
+# drawing) while the resume state keeps the integrator's float64, so a resumed
+# run continues exactly where it stopped.
+#
+# The header is the commit point: it is replaced atomically after the data
+# and state are on disk, and anything past its step count is ignored. A run
+# killed mid-append loses at most that append.
+
+HEADER = "header.json"
+CHUNK_BYTES = 64 << 20 # Size of one chunk file
+STORE_VERSION = 1
+
+def write_json_atomic(path, record):
+    tmp = f"{path}.{os.getpid()}.part"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=1)
+    os.replace(tmp, path)
+
+class TrajectoryStore:
+    def __init__(self, path, frame_shape=None, dt=1.0, dtype=np.float32, chunk=None, meta=None):
+        """Opens the store at `path`, or creates it when `frame_shape` is given and there is none."""
+        self.path = path
+        self._maps = {}
+        header = os.path.join(path, HEADER)
+        if os.path.exists(header):
+            with open(header, encoding='utf-8') as f:
+                self.header = json.load(f)
+            if frame_shape is not None and tuple(frame_shape) != self.frame_shape:
+                raise ValueError(f"{path} holds frames of shape {self.frame_shape}, not {tuple(frame_shape)}")
+            return
+        if frame_shape is None:
+            raise FileNotFoundError(f"No trajectory store at {path}")
+        frame_shape = tuple(int(n) for n in frame_shape)
+        frame_bytes = int(np.prod(frame_shape)) * np.dtype(dtype).itemsize
+        os.makedirs(path, exist_ok=True)
+        self.header = {"version": STORE_VERSION, "frame_shape": list(frame_shape),
+                       "dtype": np.dtype(dtype).str, "dt": float(dt),
+                       "chunk": int(chunk or max(1, CHUNK_BYTES // frame_bytes)),
+                       "steps": 0, "state": None, "meta": meta or {}}
+        write_json_atomic(header, self.header)
+
+    # --- Layout ---
+    @property
+    def frame_shape(self):
+        return tuple(self.header["frame_shape"])
+
+    @property
+    def dt(self):
+        return self.header["dt"]
+
+    @property
+    def chunk(self):
+        return self.header["chunk"]
+
+    @property
+    def meta(self):
+        return self.header["meta"]
+
+    def __len__(self):
+        return self.header["steps"]
+
+    def _chunk_map(self, index, writable=False):
+        key = (index, writable)
+        if key not in self._maps:
+            file = os.path.join(self.path, f"chunk_{index:05d}.npy")
+            if writable and not os.path.exists(file):
+                self._maps[key] = np.lib.format.open_memmap(
+                    file, mode='w+', dtype=np.dtype(self.header["dtype"]), shape=(self.chunk,) + self.frame_shape)
+            else:
+                self._maps[key] = np.load(file, mmap_mode='r+' if writable else 'r')
+        return self._maps[key]
+
+    # --- Writing ---
+    @property
+    def state(self):
+        """The state saved with the last append (float64), or None."""
+        name = self.header["state"]
+        return None if name is None else np.load(os.path.join(self.path, name))
+
+    def append(self, frames, state=None):
+        """Adds (n, *frame_shape) frames; `state` is what to resume from after them."""
+        frames = np.asarray(frames)
+        if frames.shape[1:] != self.frame_shape:
+            raise ValueError(f"Frames of shape {frames.shape[1:]} don't fit a store of {self.frame_shape}")
+        done, written = len(self), 0
+        while written < len(frames):
+            index, offset = divmod(done + written, self.chunk)
+            n = min(self.chunk - offset, len(frames) - written)
+            target = self._chunk_map(index, writable=True)
+            target[offset:offset + n] = frames[written:written + n]
+            target.flush()
+            written += n
+
+        old = self.header["state"]
+        if state is not None:
+            name = f"state-{done + written:012d}.npy"
+            tmp = os.path.join(self.path, f"{name}.{os.getpid()}.part")
+            with open(tmp, 'wb') as f:
+                np.save(f, np.asarray(state, dtype=np.float64))
+            os.replace(tmp, os.path.join(self.path, name))
+            self.header["state"] = name
+        self.header["steps"] = done + written
+        write_json_atomic(os.path.join(self.path, HEADER), self.header)
+        if old is not None and old != self.header["state"]:
+            os.remove(os.path.join(self.path, old))
+
+    # --- Reading ---
+    def read(self, start=0, stop=None, step=1):
+        """Frames [start, stop) as one (n, *frame_shape) array, reading only the chunks they are in."""
+        start, stop, step = slice(start, stop, step).indices(len(self))
+        steps = np.arange(start, stop, step)
+        out = np.empty((len(steps),) + self.frame_shape, dtype=np.dtype(self.header["dtype"]))
+        chunks = steps // self.chunk
+        for index in np.unique(chunks):
+            rows = chunks == index
+            out[rows] = self._chunk_map(int(index))[steps[rows] - index * self.chunk]
+        return out
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.read(key.start, key.stop, key.step or 1)
+        key = range(len(self))[key]
+        return self._chunk_map(key // self.chunk)[key % self.chunk]
+
+    def step_range(self, t0=0.0, t1=None):
+        """First and last+1 step inside the time window [t0, t1]."""
+        start = max(0, int(np.ceil(t0 / self.dt - 1e-9)))
+        stop = len(self) if t1 is None else min(len(self), int(np.floor(t1 / self.dt + 1e-9)) + 1)
+        return start, max(start, stop)
+
+    def window(self, t0=0.0, t1=None, step=1):
+        """Frames with t0 <= time <= t1 (time = step * dt)."""
+        return self.read(*self.step_range(t0, t1), step)
+
+    def blocks(self, start=0, stop=None):
+        """Yields the range chunk by chunk as read-only memory-mapped views (no copies)."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        while start < stop:
+            index, offset = divmod(start, self.chunk)
+            n = min(self.chunk - offset, stop - start)
+            yield self._chunk_map(index)[offset:offset + n]
+            start += n